@@ -34,7 +34,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sc2.ids.unit_typeid import UnitTypeId as UnitID
 from sc2.position import Point2
@@ -204,6 +204,14 @@ class ConstructionQueue:
             and o.status in (OrderStatus.PENDING, OrderStatus.CLAIMED, OrderStatus.BUILDING)
         )
 
+    def counts_by_type(self) -> Dict[UnitID, int]:
+        """count_active_of_type() for every structure type, in one pass."""
+        counts: Dict[UnitID, int] = {}
+        for o in self._orders:
+            if o.status in (OrderStatus.PENDING, OrderStatus.CLAIMED, OrderStatus.BUILDING):
+                counts[o.structure_type] = counts.get(o.structure_type, 0) + 1
+        return counts
+
     # ------------------------------------------------------------------
     # Lifecycle transitions — called by MorphTracker
     # ------------------------------------------------------------------
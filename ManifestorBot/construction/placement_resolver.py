@@ -48,6 +48,24 @@ if TYPE_CHECKING:
 
 log = get_logger()
 
+# Tech and production buildings that best_base_for() always places in the
+# main base.
+_MAIN_BASE_ONLY: frozenset = frozenset({
+    UnitID.SPAWNINGPOOL,
+    UnitID.EVOLUTIONCHAMBER,
+    UnitID.LAIR,
+    UnitID.HIVE,
+    UnitID.SPIRE,
+    UnitID.GREATERSPIRE,
+    UnitID.HYDRALISKDEN,
+    UnitID.ROACHWARREN,
+    UnitID.BANELINGNEST,
+    UnitID.ULTRALISKCAVERN,
+    UnitID.INFESTATIONPIT,
+    UnitID.NYDUSNETWORK,
+    UnitID.LURKERDENMP,
+})
+
 
 class PlacementResolver:
     """
@@ -219,21 +237,6 @@ class PlacementResolver:
         logic (e.g. building a Spine Crawler at a threatened expansion).
         """
         # Tech and production buildings → main base
-        _MAIN_BASE_ONLY = {
-            UnitID.SPAWNINGPOOL,
-            UnitID.EVOLUTIONCHAMBER,
-            UnitID.LAIR,
-            UnitID.HIVE,
-            UnitID.SPIRE,
-            UnitID.GREATERSPIRE,
-            UnitID.HYDRALISKDEN,
-            UnitID.ROACHWARREN,
-            UnitID.BANELINGNEST,
-            UnitID.ULTRALISKCAVERN,
-            UnitID.INFESTATIONPIT,
-            UnitID.NYDUSNETWORK,
-            UnitID.LURKERDENMP,
-        }
         if structure_type in _MAIN_BASE_ONLY:
             return bot.start_location
 
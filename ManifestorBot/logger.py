@@ -21,6 +21,8 @@ Usage
 
 The log file lives at  logs/manifestor_<timestamp>.log  next to run.py.
 Old log files are kept for up to LOG_BACKUP_COUNT runs before being deleted.
+The file log level defaults to DEBUG; override it with the
+MANIFESTOR_LOG_LEVEL environment variable (e.g. MANIFESTOR_LOG_LEVEL=INFO).
 """
 
 from __future__ import annotations
@@ -36,8 +38,23 @@ from typing import Optional
 
 # ── Configuration ────────────────────────────────────────────────────────────
 
+def _env_log_level(default: int) -> int:
+    """Level named by $MANIFESTOR_LOG_LEVEL (e.g. INFO, WARNING, 20), else *default*."""
+    name = os.environ.get("MANIFESTOR_LOG_LEVEL", "").strip().upper()
+    if not name:
+        return default
+    if name.isdigit():
+        return int(name)
+    level = logging.getLevelName(name)
+    return level if isinstance(level, int) else default
+
+
 LOG_DIR         = Path("logs")          # Relative to CWD (i.e. project root)
-LOG_LEVEL       = logging.DEBUG         # File log level  (very verbose)
+# File log level (very verbose by default). Set MANIFESTOR_LOG_LEVEL=INFO
+# for ladder / timing runs: log.debug() calls and the
+# `if log.is_enabled_for(logging.DEBUG):` blocks on hot paths then skip
+# their formatting and evidence work entirely.
+LOG_LEVEL       = _env_log_level(logging.DEBUG)
 CONSOLE_LEVEL   = logging.INFO          # Console level   (INFO and above)
 LOG_BACKUP_COUNT = 10                   # How many old log files to keep
 MAX_BYTES        = 5 * 1024 * 1024      # 5 MB per file before rotating
@@ -146,10 +163,26 @@ class ManifestorLogger:
             log_file.resolve(),
         )
 
+    # ── Level checks ──────────────────────────────────────────────────────────
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        True if a record at *level* would be emitted.
+
+        Use this to skip building expensive log arguments on hot paths:
+
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug("orders=%s", [o.ability.id.name for o in unit.orders])
+        """
+        return self._logger.isEnabledFor(level)
+
     # ── Standard log levels ───────────────────────────────────────────────────
 
     def debug(self, msg: str, *args, frame: Optional[int] = None, **kwargs) -> None:
-        self._logger.debug(msg, *args, extra={"frame": frame}, **kwargs)
+        # Level check before the extra dict is built — the stdlib check
+        # inside Logger.debug() comes too late to save the allocation.
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(msg, *args, extra={"frame": frame}, **kwargs)
 
     def info(self, msg: str, *args, frame: Optional[int] = None, **kwargs) -> None:
         self._logger.info(msg, *args, extra={"frame": frame}, **kwargs)
@@ -172,15 +205,29 @@ class ManifestorLogger:
         self,
         event_type: str,
         detail: str,
+        *args,
         frame: Optional[int] = None,
     ) -> None:
         """
         Log a significant named game event (strategy pivots, game start/end, etc.).
 
+        With extra positional args, *detail* is a %-format string that is
+        only rendered if the record is emitted.
+
         Example:
             log.game_event("PIVOT", "STOCK_STANDARD → AGGRESSIVE", frame=1280)
             log.game_event("GAME_END", "Result.Victory", frame=45000)
+            log.game_event("TECH_MORPH", "%s → %s", old.name, new.name, frame=1280)
         """
+        if args:
+            self._logger.log(
+                GAME_EVENT_LEVEL,
+                "%s | " + detail,
+                event_type.upper(),
+                *args,
+                extra={"frame": frame},
+            )
+            return
         self._logger.log(
             GAME_EVENT_LEVEL,
             "%s | %s",
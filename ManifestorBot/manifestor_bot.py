@@ -8,7 +8,8 @@ The core loop implementation:
 - Chat commentary for debugging and validation
 """
 
-from typing import Optional, Dict, List, Set
+import logging
+from typing import Optional, Dict, List, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from sc2.data import Result
@@ -30,6 +31,7 @@ from ManifestorBot.logger import get_logger
 from ManifestorBot.manifests.tactics.building_base import (
     BuildingTacticModule,
     BuildingIdea,
+    BuildingFrameCache,
 )
 from ManifestorBot.manifests.tactics.building_tactics import (
     ZergWorkerProductionTactic,
@@ -83,6 +85,9 @@ from ManifestorBot.manifests.tactics.extractor_trick import ExtractorTrick
 
 log = get_logger()
 
+# Structures whose building-idea confidence race is logged in full.
+_TOWNHALL_TYPES: frozenset = frozenset({UnitID.HATCHERY, UnitID.LAIR, UnitID.HIVE})
+
 
 class ManifestorBot(AresBot):
     """
@@ -137,10 +142,24 @@ class ManifestorBot(AresBot):
 
         # Building tactic modules registry (parallel to self.tactic_modules)
         self.building_modules: List[BuildingTacticModule] = []
+        # type_id → modules whose BUILDING_TYPES covers it (registry order),
+        # filled lazily by _building_modules_for().
+        self._building_modules_by_type: Dict[UnitID, List[BuildingTacticModule]] = {}
+
+        # Rally cache — tracks the last rally point set per building tag,
+        # stored as an (x, y) tuple. ZergRallyTactic uses this to avoid
+        # redundant rally updates.
+        self._building_rally_cache: Dict[int, Tuple[float, float]] = {}
+
+        # Structure types whose whole upgrade list is researched.
+        # ZergUpgradeResearchTactic stops evaluating them — upgrades are
+        # never lost, so an entry here is permanent for the game.
+        self._upgrade_structures_done: Set[UnitID] = set()
+
+        # Per-frame memo for the building tactics' helpers. Replaced at the
+        # top of every on_step so nothing in it outlives its observation.
+        self.frame_cache = BuildingFrameCache()
 
-        # Rally cache — tracks the last rally point set per building tag.
-        # ZergRallyTactic uses this to avoid redundant rally updates.
-        self._building_rally_cache: dict = {}
         
         # Suppressed ideas tracker (prevents spam)
         self.suppressed_ideas: Dict[int, int] = {}  # unit_tag -> frame_last_suppressed
@@ -247,6 +266,7 @@ class ManifestorBot(AresBot):
         
     async def on_step(self, iteration: int) -> None:
         """Main game loop - this is where the magic happens"""
+        self.frame_cache = BuildingFrameCache()
         await super().on_step(iteration)
 
         # Drain any chat messages queued by synchronous code (e.g. change_strategy)
@@ -714,11 +734,33 @@ class ManifestorBot(AresBot):
             CrawlerUprootBuildingTactic(), # Uproot orphaned crawlers after base loss
         ]
 
+        self._building_modules_by_type = {}
+
         log.info(
             "Building modules loaded: %s",
             ", ".join(m.name for m in self.building_modules),
         )
 
+    def _building_modules_for(self, type_id: UnitID) -> List[BuildingTacticModule]:
+        """
+        Building modules that can apply to structures of this type.
+
+        A module is included when its BUILDING_TYPES contains type_id, or
+        when BUILDING_TYPES is empty (applies to every structure type, e.g.
+        CancelDyingBuildingTactic). Registry order is preserved so equal-
+        confidence ties resolve exactly as before. Each module's
+        is_applicable already rejects types outside BUILDING_TYPES, so this
+        only skips calls that could never succeed.
+        """
+        modules = self._building_modules_by_type.get(type_id)
+        if modules is None:
+            modules = [
+                m for m in self.building_modules
+                if not m.BUILDING_TYPES or type_id in m.BUILDING_TYPES
+            ]
+            self._building_modules_by_type[type_id] = modules
+        return modules
+
 
     # ---- E2: Main building idea loop ----
 # ---- E2: Main building idea loop ----
@@ -772,7 +814,7 @@ class ManifestorBot(AresBot):
         ideas: list[tuple["BuildingTacticModule", "BuildingIdea"]] = []
         counter_ctx = self.scout_ledger.get_counter_context(self.state.game_loop)
 
-        for module in self.building_modules:
+        for module in self._building_modules_for(structure.type_id):
             applicable = False
             try:
                 applicable = module.is_applicable(structure, self)
@@ -823,9 +865,11 @@ class ManifestorBot(AresBot):
         best_module, best_idea = ideas[0]
 
         # Log the full candidate list for Hatcheries so the confidence race is visible
-        if structure.type_id in {
-            UnitID.HATCHERY, UnitID.LAIR, UnitID.HIVE
-        } and len(ideas) > 1:
+        if (
+            len(ideas) > 1
+            and structure.type_id in _TOWNHALL_TYPES
+            and log.is_enabled_for(logging.DEBUG)
+        ):
             shortlist = ", ".join(
                 f"{m.name}({i.confidence:.2f})"
                 for m, i in ideas
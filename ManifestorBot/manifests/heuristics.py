@@ -478,9 +478,10 @@ class HeuristicManager:
         score += min(0.3, bases * 0.075)  # 4 bases = 0.3
         
         # Tech tier: Lair = 0.2, Hive = 0.4
-        if self.bot.structures(UnitID.HIVE).ready:
+        structures = self.bot.mediator.get_own_structures_dict
+        if any(s.is_ready for s in structures.get(UnitID.HIVE, ())):
             score += 0.4
-        elif self.bot.structures(UnitID.LAIR).ready:
+        elif any(s.is_ready for s in structures.get(UnitID.LAIR, ())):
             score += 0.2
         
         # Upgrade count (each completed upgrade = small phase bump)
@@ -17,14 +17,15 @@ class ResourcePressureManager:
     SOFT_THRESHOLD = 800    # minerals: begin ramping
     PANIC_THRESHOLD = 1500  # minerals: force spending
 
-    def army_production_boost(self, bot: "ManifestorBot") -> float:
+    def army_pressure(self, bot: "ManifestorBot") -> tuple[float, bool]:
+        """(army production confidence boost, panic mode) from a single minerals read."""
         mins = bot.minerals
+        return self._boost_for(mins), mins >= self.PANIC_THRESHOLD
+
+    def _boost_for(self, mins: float) -> float:
         if mins >= self.PANIC_THRESHOLD:
             return 0.40          # panic → confidence will be forced to 0.92
         elif mins >= self.SOFT_THRESHOLD:
             frac = (mins - self.SOFT_THRESHOLD) / (self.PANIC_THRESHOLD - self.SOFT_THRESHOLD)
             return frac * 0.20   # linear ramp 0.0 → 0.20
         return 0.0
-
-    def is_panic_mode(self, bot: "ManifestorBot") -> bool:
-        return bot.minerals >= self.PANIC_THRESHOLD
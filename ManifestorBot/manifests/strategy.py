@@ -151,15 +151,10 @@ class Strategy(Enum):
     # ------------------------------------------------------------------ #
 
     def is_aggressive(self) -> bool:
-        return self in {
-            Strategy.JUST_GO_PUNCH_EM,
-            Strategy.ALL_IN,
-            Strategy.KEEP_EM_BUSY,
-            Strategy.WAR_ON_SANITY,
-        }
+        return self in _AGGRESSIVE_STRATEGIES
 
     def is_defensive(self) -> bool:
-        return self in {Strategy.DRONE_ONLY_FORTRESS}
+        return self in _DEFENSIVE_STRATEGIES
 
     def is_balanced(self) -> bool:
         return not (self.is_aggressive() or self.is_defensive())
@@ -179,6 +174,16 @@ class Strategy(Enum):
         return _PROFILES[self]
 
 
+# Classification sets, built once rather than on every is_*() call.
+_AGGRESSIVE_STRATEGIES: frozenset = frozenset({
+    Strategy.JUST_GO_PUNCH_EM,
+    Strategy.ALL_IN,
+    Strategy.KEEP_EM_BUSY,
+    Strategy.WAR_ON_SANITY,
+})
+_DEFENSIVE_STRATEGIES: frozenset = frozenset({Strategy.DRONE_ONLY_FORTRESS})
+
+
 # ------------------------------------------------------------------ #
 # Profile definitions — one per strategy
 # Keeping these outside the enum body avoids forward-reference issues.
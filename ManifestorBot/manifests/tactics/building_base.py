@@ -40,6 +40,7 @@ from sc2.ids.upgrade_id import UpgradeId
 from sc2.unit import Unit
 from sc2.position import Point2
 from sc2.data import Race
+from sc2.dicts.upgrade_researched_from import UPGRADE_RESEARCHED_FROM
 
 if TYPE_CHECKING:
     from ManifestorBot.manifestor_bot import ManifestorBot
@@ -47,6 +48,16 @@ if TYPE_CHECKING:
     from ManifestorBot.manifests.strategy import Strategy
 
 
+# Research cost rows (minerals, vespene) per upgrade. Game data is fixed
+# for the whole match, so each row is filled on first use and kept.
+_UPGRADE_COST: dict[UpgradeId, tuple[int, int]] = {}
+
+# Same idea for training: (minerals, vespene, supply) per unit type, from
+# calculate_unit_value — the unit's full value, not the incremental
+# calculate_cost that building_tactics._TRAIN_COST holds.
+_UNIT_VALUE_COST: dict[UnitID, tuple[int, int, float]] = {}
+
+
 # ---------------------------------------------------------------------------
 # Action enum
 # ---------------------------------------------------------------------------
@@ -63,11 +74,14 @@ class BuildingAction(Enum):
 # Idea dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class BuildingIdea:
     """
     A building's generated idea, parallel to unit TacticIdea.
 
+    Slotted: every tactic builds one of these per building per tick, and
+    nothing attaches extra attributes to them.
+
     Fields
     ------
     building_module : BuildingTacticModule
@@ -95,6 +109,63 @@ class BuildingIdea:
     rally_point: Optional[Point2] = None
 
 
+# ---------------------------------------------------------------------------
+# Per-frame cache
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class BuildingFrameCache:
+    """
+    Per-game-loop memo shared by the building tactics.
+
+    ManifestorBot owns one as ``bot.frame_cache`` and replaces it at the
+    top of every on_step, so no entry outlives the observation it was
+    computed from and none needs its own frame stamp. Keeping it on the
+    bot rather than at module level means two bots in one process never
+    read each other's state. Every field starts empty and is filled on
+    first use by the helper that owns it (building_tactics, plus
+    BuildingTacticModule._is_being_researched).
+
+    minerals / supply_left are never cached: python-sc2 deducts them as
+    soon as a train command is issued, so they are read live, and the one
+    memo that depends on them (expand_memo) is keyed on the live value.
+    """
+    # _max_for_structure(EXTRACTOR)
+    extractor_cap: Optional[int] = None
+    # _larva_near: larva positions, and counts keyed by townhall tag
+    larva_xy: Optional[list] = None
+    larva_near: dict = field(default_factory=dict)
+    # _ready_index: ready count per structure type, and its keys
+    ready_counts: Optional[dict] = None
+    ready_types: frozenset = frozenset()
+    # _units_by_type: own units grouped by type_id
+    units_by_type: Optional[dict] = None
+    # _pending / _tech_progress: memoized bot queries keyed by UnitID
+    pending: dict = field(default_factory=dict)
+    tech_progress: dict = field(default_factory=dict)
+    # _army_supply_snapshot: (combat_supply, supply_by_type)
+    army_supply: Optional[tuple] = None
+    # _army_centroid / ZergRallyTactic._rally_target
+    army_centroid: Optional[Point2] = None
+    rally_target: Optional[Point2] = None
+    # _queen_status: (ready_hatcheries, queens, pending_queens, quota)
+    queen_status: Optional[tuple] = None
+    # _macro_snapshot: building_tactics._MacroSnapshot
+    macro_snapshot: Optional[object] = None
+    # _mineral_miners: shared list, claimed drones are removed from it
+    mineral_miners: Optional[list] = None
+    # _is_being_researched: answers keyed by UpgradeId
+    researching: dict = field(default_factory=dict)
+    # ZergStructureBuildTactic._pick_priority_structure — None is a valid
+    # pick, so validity is tracked separately; execute() clears it
+    structure_pick: Optional[UnitID] = None
+    structure_pick_valid: bool = False
+    # ZergStructureBuildTactic._free_expansion: (townhall_count, location)
+    free_expansion: Optional[tuple] = None
+    # ZergStructureBuildTactic._maybe_expand: (minerals, decision)
+    expand_memo: Optional[tuple] = None
+
+
 # ---------------------------------------------------------------------------
 # Base class
 # ---------------------------------------------------------------------------
@@ -165,7 +236,7 @@ class BuildingTacticModule(ABC):
                     return False
                 if not building.is_ready:
                     return False
-                if building.orders:     # already busy
+                if not building.is_idle:     # already busy
                     return False
                 if bot.current_strategy in self.blocked_strategies:
                     return False
@@ -324,12 +395,17 @@ class BuildingTacticModule(ABC):
     # ---------------------------------------------------------------- #
 
     def _building_is_idle(self, building: Unit) -> bool:
-        """True if the building has no current orders (not training/researching)."""
-        return not building.orders
+        """True if the building has no current orders (not training/researching).
+
+        Uses ``is_idle`` (a truthiness test on the raw proto order list)
+        rather than ``orders``, which builds a fresh list of UnitOrder
+        objects on every access.
+        """
+        return building.is_idle
 
     def _building_is_ready(self, building: Unit) -> bool:
         """True if the building has finished construction."""
-        return building.is_ready and building.build_progress >= 1.0
+        return building.build_progress >= 1.0
 
     def _can_afford_train(self, unit_type: UnitID, bot: "ManifestorBot") -> bool:
         """Check minerals + vespene + supply for a training order.
@@ -337,14 +413,18 @@ class BuildingTacticModule(ABC):
         Uses bot.available_minerals (minerals minus emergency reserve) so the
         emergency extractor shield always has funds available.
         """
-        cost = bot.calculate_unit_value(unit_type)
+        cost = _UNIT_VALUE_COST.get(unit_type)
         if cost is None:
-            return False
+            c = bot.calculate_unit_value(unit_type)
+            if c is None:
+                return False
+            cost = (c.minerals, c.vespene, bot.calculate_supply_cost(unit_type))
+            _UNIT_VALUE_COST[unit_type] = cost
         spendable = getattr(bot, "available_minerals", bot.minerals)
         return (
-            spendable >= cost.minerals
-            and bot.vespene >= cost.vespene
-            and (bot.supply_cap - bot.supply_used) >= bot.calculate_supply_cost(unit_type)
+            spendable >= cost[0]
+            and bot.vespene >= cost[1]
+            and (bot.supply_cap - bot.supply_used) >= cost[2]
         )
 
     def _can_afford_research(self, upgrade: UpgradeId, bot: "ManifestorBot") -> bool:
@@ -352,11 +432,15 @@ class BuildingTacticModule(ABC):
 
         Uses bot.available_minerals so the emergency extractor reserve is respected.
         """
-        cost = bot.calculate_cost(upgrade)
+        cost = _UPGRADE_COST.get(upgrade)
         if cost is None:
-            return False
+            c = bot.calculate_cost(upgrade)
+            if c is None:
+                return False
+            cost = (c.minerals, c.vespene)
+            _UPGRADE_COST[upgrade] = cost
         spendable = getattr(bot, "available_minerals", bot.minerals)
-        return spendable >= cost.minerals and bot.vespene >= cost.vespene
+        return spendable >= cost[0] and bot.vespene >= cost[1]
 
     def _already_researched(self, upgrade: UpgradeId, bot: "ManifestorBot") -> bool:
         """True if the upgrade is already complete."""
@@ -364,13 +448,24 @@ class BuildingTacticModule(ABC):
 
     def _is_being_researched(self, upgrade: UpgradeId, bot: "ManifestorBot") -> bool:
         """True if any friendly structure is currently researching this upgrade."""
-        from sc2.dicts.upgrade_researched_from import UPGRADE_RESEARCHED_FROM
+        # Orders only change between observations, so one structure walk
+        # per upgrade per frame is enough no matter how many buildings ask.
+        researching = bot.frame_cache.researching
+        cached = researching.get(upgrade)
+        if cached is not None:
+            return cached
+
+        result = False
         researcher_type = UPGRADE_RESEARCHED_FROM.get(upgrade)
-        if researcher_type is None:
-            return False
-        for struct in bot.structures(researcher_type):
-            for order in struct.orders:
-                # AbilityId names contain the upgrade name — good enough for a gate
-                if upgrade.name.lower() in order.ability.id.name.lower():
-                    return True
-        return False
+        if researcher_type is not None:
+            needle = upgrade.name.lower()
+            for struct in bot.mediator.get_own_structures_dict.get(researcher_type, ()):
+                for order in struct.orders:
+                    # AbilityId names contain the upgrade name — good enough for a gate
+                    if needle in order.ability.id.name.lower():
+                        result = True
+                        break
+                if result:
+                    break
+        researching[upgrade] = result
+        return result
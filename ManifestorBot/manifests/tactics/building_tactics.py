@@ -16,8 +16,12 @@ These are self-contained and registered in ManifestorBot._load_building_modules(
 
 from __future__ import annotations
 
+import heapq
+import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, List
 
+from sc2.ids.ability_id import AbilityId
 from sc2.ids.unit_typeid import UnitTypeId as UnitID
 from sc2.ids.upgrade_id import UpgradeId
 from sc2.position import Point2
@@ -179,14 +183,35 @@ _STRUCTURE_UTILIZATION_GATE: dict[UnitID, tuple[float, tuple]] = {
     ),
 }
 
+# _STRUCTURE_PRIORITY with each entry's static gate data resolved at import:
+# (structure_type, prerequisite, min_minerals, queen_gated, army_gated,
+#  utilization_gate_or_None, static_max_or_None). static_max is None only
+# for types whose cap is dynamic (EXTRACTOR) and must go through
+# _max_for_structure() each tick.
+_STRUCTURE_PRIORITY_ROWS: tuple = tuple(
+    (
+        _t,
+        _prereq,
+        _min_minerals,
+        _t in _QUEEN_GATED_STRUCTURES,
+        _t in _ARMY_GATED_STRUCTURES,
+        _STRUCTURE_UTILIZATION_GATE.get(_t),
+        None if _t == UnitID.EXTRACTOR
+        else _MAX_STRUCTURE_COUNT.get(_t, _DEFAULT_MAX_STRUCTURES),
+    )
+    for _t, _prereq, _min_minerals in _STRUCTURE_PRIORITY
+)
+
 
 def _utilization_supply(unit_types: tuple, bot) -> float:
-    """Sum SUPPLY_COST for all alive units of the given types."""
-    return sum(
-        SUPPLY_COST.get(u.type_id, 1)
-        for t in unit_types
-        for u in bot.units(t)
-    )
+    """
+    Sum SUPPLY_COST for all alive units of the given types.
+
+    Reads the per-frame combat supply breakdown: every gate type is a
+    combat unit listed in SUPPLY_COST, so its supply is already there.
+    """
+    supply_by_type = _army_supply_snapshot(bot)[1]
+    return sum(supply_by_type.get(t, 0) for t in unit_types)
 
 
 def _building_at_capacity(structure_type: UnitID, existing_ready, bot) -> bool:
@@ -207,7 +232,7 @@ def _building_at_capacity(structure_type: UnitID, existing_ready, bot) -> bool:
         return True  # nothing exists yet — utilization gate irrelevant
 
     if structure_type == UnitID.EVOLUTIONCHAMBER:
-        return all(len(b.orders) > 0 for b in existing_ready)
+        return not any(b.is_idle for b in existing_ready)
 
     # Default: passive buildings are always "at capacity" (no internal slots to fill)
     return True
@@ -216,19 +241,248 @@ def _building_at_capacity(structure_type: UnitID, existing_ready, bot) -> bool:
 def _max_for_structure(structure_type: UnitID, bot) -> int:
     """Return the max allowed count for a structure, with dynamic caps."""
     if structure_type == UnitID.EXTRACTOR:
+        # The only dynamic entry. It walks every ready extractor and its
+        # geyser, and the priority walk, counter path and static gates can
+        # each ask for it in the same tick — cache it on the frame cache.
+        cache = bot.frame_cache
+        if cache.extractor_cap is not None:
+            return cache.extractor_cap
         # 1 extractor per ready base. Allow +1 for each existing extractor
         # sitting on a depleted geyser (< 50 vespene remaining), so the
         # second geyser at that base opens automatically when the first
         # runs dry — but not before.
-        base_cap = bot.townhalls.ready.amount
+        base_cap = _ready_townhall_count(bot)
         depleted_bonus = 0
+        geysers = bot.vespene_geyser
         for gas in bot.gas_buildings.ready:
-            nearby = list(bot.vespene_geyser.closer_than(1.5, gas.position))
-            if nearby and nearby[0].vespene_contents < 50:
-                depleted_bonus += 1
-        return max(1, base_cap + depleted_bonus)
+            # The geyser under an extractor is the first within 1.5 —
+            # squared-distance walk in place of a closer_than() Units build.
+            gx, gy = gas.position
+            for geyser in geysers:
+                x, y = geyser.position
+                dx = x - gx
+                dy = y - gy
+                if dx * dx + dy * dy < 2.25:
+                    if geyser.vespene_contents < 50:
+                        depleted_bonus += 1
+                    break
+        cache.extractor_cap = max(1, base_cap + depleted_bonus)
+        return cache.extractor_cap
     return _MAX_STRUCTURE_COUNT.get(structure_type, _DEFAULT_MAX_STRUCTURES)
 
+
+def _is_townhall(tid: UnitID) -> bool:
+    """
+    True for HATCHERY / LAIR / HIVE.
+
+    Chained identity compares (enum members are singletons) instead of a
+    frozenset test, whose Enum.__hash__ is a Python-level call; HATCHERY,
+    by far the most common townhall, is checked first.
+    """
+    return tid is UnitID.HATCHERY or tid is UnitID.LAIR or tid is UnitID.HIVE
+
+
+def _is_extractor(tid: UnitID) -> bool:
+    """True for EXTRACTOR / EXTRACTORRICH; identity compares as in _is_townhall."""
+    return tid is UnitID.EXTRACTOR or tid is UnitID.EXTRACTORRICH
+
+
+# Larva within this radius of a townhall count as "its" larva — matches the
+# radius used by BuildingTacticModule._execute_train.
+_LARVA_RADIUS: float = 15.0
+_LARVA_RADIUS_SQ: float = _LARVA_RADIUS * _LARVA_RADIUS
+
+def _larva_near(building: "Unit", bot) -> int:
+    """
+    Number of larva within _LARVA_RADIUS of *building*, cached per frame.
+
+    Several tactics ask the same question for the same hatchery every
+    tick; the scan over the larva positions is done at most once per
+    building per game loop, and the positions themselves are collected
+    once per loop.
+    """
+    cache = bot.frame_cache
+    counts = cache.larva_near
+    count = counts.get(building.tag)
+    if count is None:
+        larva_xy = cache.larva_xy
+        if larva_xy is None:
+            # Unit.position is a cached_property; reading it once per larva
+            # here leaves each townhall's scan as a walk over plain Point2s.
+            larva_xy = cache.larva_xy = [larva.position for larva in bot.larva]
+        bx, by = building.position
+        count = 0
+        for lx, ly in larva_xy:
+            dx = lx - bx
+            dy = ly - by
+            if dx * dx + dy * dy < _LARVA_RADIUS_SQ:
+                count += 1
+        counts[building.tag] = count
+    return count
+
+
+def _ready_index(bot) -> dict:
+    """
+    Count of finished structures per type for the current frame.
+
+    Prerequisite checks ("is a pool ready?") and ready counts ("how many
+    ready bases?") hit this instead of filtering bot.structures for every
+    candidate on every townhall. Derived from Ares' own-structures dict,
+    which is already grouped by type each step.
+    """
+    cache = bot.frame_cache
+    counts = cache.ready_counts
+    if counts is None:
+        counts = {}
+        for t, structures in bot.mediator.get_own_structures_dict.items():
+            ready = sum(1 for s in structures if s.build_progress >= 1.0)
+            if ready:
+                counts[t] = ready
+        cache.ready_counts = counts
+        cache.ready_types = frozenset(counts)
+    return counts
+
+
+def _ready_structure_types(bot) -> frozenset:
+    """Types of all ready friendly structures, cached for the current frame."""
+    _ready_index(bot)
+    return bot.frame_cache.ready_types
+
+
+def _ready_count(structure_type: UnitID, bot) -> int:
+    """Number of ready friendly structures of *structure_type* this frame."""
+    return _ready_index(bot).get(structure_type, 0)
+
+
+def _ready_townhall_count(bot) -> int:
+    """len(bot.townhalls.ready), without building the filtered Units."""
+    counts = _ready_index(bot)
+    return (
+        counts.get(UnitID.HATCHERY, 0)
+        + counts.get(UnitID.LAIR, 0)
+        + counts.get(UnitID.HIVE, 0)
+    )
+
+
+def _units_by_type(bot) -> dict:
+    """
+    Own units grouped by type_id for the current frame (do not mutate).
+
+    Replaces repeated bot.units(t) filters, each of which is a full linear
+    scan, with one pass per frame and dict lookups after that. Structures
+    need no index of their own: Ares already keeps
+    mediator.get_own_structures_dict.
+    """
+    cache = bot.frame_cache
+    units = cache.units_by_type
+    if units is None:
+        units = {}
+        for u in bot.units:
+            units.setdefault(u.type_id, []).append(u)
+        cache.units_by_type = units
+    return units
+
+
+def _units_of(unit_type: UnitID, bot) -> list:
+    """Own units of exactly *unit_type* this frame (do not mutate)."""
+    return _units_by_type(bot).get(unit_type, [])
+
+
+def _structures_of(structure_type: UnitID, bot) -> list:
+    """Own structures of exactly *structure_type* this frame (do not mutate)."""
+    return bot.mediator.get_own_structures_dict.get(structure_type, [])
+
+
+def _pending(unit_type: UnitID, bot) -> float:
+    """
+    bot.already_pending(*unit_type*), memoized for the current frame.
+
+    python-sc2 caches the ability counter per frame, but every call still
+    resolves the creation ability through game_data and builds an
+    AbilityId; the answer cannot change within a frame, so each type is
+    resolved once.
+    """
+    pending = bot.frame_cache.pending
+    count = pending.get(unit_type)
+    if count is None:
+        count = pending[unit_type] = bot.already_pending(unit_type)
+    return count
+
+
+# Train cost rows (minerals, vespene, supply) per unit type. Game data is
+# fixed for the whole match, so each row is filled on first use and kept.
+_TRAIN_COST: dict[UnitID, tuple[int, int, float]] = {}
+
+
+def _can_afford_unit(unit_type: UnitID, bot) -> bool:
+    """
+    Same answer as bot.can_afford(unit_type), minus the cost-table walk.
+
+    Resources are read live rather than cached: a successful train earlier
+    in the same frame has already deducted its cost.
+    """
+    cost = _TRAIN_COST.get(unit_type)
+    if cost is None:
+        c = bot.calculate_cost(unit_type)
+        cost = (c.minerals, c.vespene, bot.calculate_supply_cost(unit_type))
+        _TRAIN_COST[unit_type] = cost
+    minerals, vespene, supply = cost
+    return (
+        bot.minerals >= minerals
+        and bot.vespene >= vespene
+        and (not supply or bot.supply_left >= supply)
+    )
+
+
+def _tech_progress(unit_type: UnitID, bot) -> float:
+    """
+    bot.tech_requirement_progress(unit_type), cached for the current frame.
+
+    Tech only changes between game loops, so one lookup per type per
+    frame is enough.
+    """
+    cached = bot.frame_cache.tech_progress
+    progress = cached.get(unit_type)
+    if progress is None:
+        progress = cached[unit_type] = bot.tech_requirement_progress(unit_type)
+    return progress
+
+
+# Unit types that never count toward combat supply.
+_WORKER_AND_SUPPORT: frozenset = frozenset({
+    UnitID.DRONE, UnitID.QUEEN, UnitID.OVERLORD,
+    UnitID.OVERSEER, UnitID.OVERLORDCOCOON,
+})
+
+
+def _army_supply_snapshot(bot) -> tuple[float, dict[UnitID, float]]:
+    """
+    Combat supply total and its per-type breakdown (SUPPLY_COST, default 2).
+
+    Every idle hatchery asks for both during army production; they are
+    built once per game loop. Sums per type over the type index instead of
+    per unit, so there is one SUPPLY_COST lookup for each distinct type on
+    the map. The returned dict is shared for the frame — do not mutate.
+    """
+    cache = bot.frame_cache
+    snapshot = cache.army_supply
+    if snapshot is None:
+        by_type: dict[UnitID, float] = {}
+        total = 0
+        for t, units in _units_by_type(bot).items():
+            if t in _WORKER_AND_SUPPORT:
+                continue
+            supply = SUPPLY_COST.get(t, 2) * len(units)
+            by_type[t] = supply
+            total += supply
+        snapshot = cache.army_supply = (total, by_type)
+    return snapshot
+
+
+def _combat_supply(bot) -> float:
+    """Supply held by combat units this frame."""
+    return _army_supply_snapshot(bot)[0]
+
 # ---------------------------------------------------------------------------
 # 1. Worker Production
 # ---------------------------------------------------------------------------
@@ -258,23 +512,25 @@ class ZergWorkerProductionTactic(BuildingTacticModule):
     })
 
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        if not _is_townhall(building.type_id):
             return False
         if not self._building_is_ready(building):
-            log.debug(
-                "ZergWorkerProductionTactic: %s not ready (build_progress=%.2f)",
-                building.type_id.name,
-                building.build_progress,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergWorkerProductionTactic: %s not ready (build_progress=%.2f)",
+                    building.type_id.name,
+                    building.build_progress,
+                    frame=bot.state.game_loop,
+                )
             return False
         if not self._building_is_idle(building):
-            log.debug(
-                "ZergWorkerProductionTactic: %s not idle (orders=%s)",
-                building.type_id.name,
-                [o.ability.id.name for o in building.orders],
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergWorkerProductionTactic: %s not idle (orders=%s)",
+                    building.type_id.name,
+                    [o.ability.id.name for o in building.orders],
+                    frame=bot.state.game_loop,
+                )
             return False
         if bot.current_strategy in self.blocked_strategies:
             return False
@@ -283,12 +539,23 @@ class ZergWorkerProductionTactic(BuildingTacticModule):
             return False
         if bot.minerals < 50:
             return False
-        if not bot.larva:
-            log.debug(
-                "ZergWorkerProductionTactic: no larva available near %s",
-                building.type_id.name,
-                frame=bot.state.game_loop,
-            )
+        # Fully saturated — no drone wanted, skip scoring entirely.
+        delta = bot.heuristic_manager.get_state().saturation_delta
+        if delta <= 0:
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergWorkerProductionTactic: fully saturated (delta=%.1f)",
+                    delta,
+                    frame=bot.state.game_loop,
+                )
+            return False
+        if not _larva_near(building, bot):
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergWorkerProductionTactic: no larva available near %s",
+                    building.type_id.name,
+                    frame=bot.state.game_loop,
+                )
             return False
         return True
 
@@ -300,20 +567,21 @@ class ZergWorkerProductionTactic(BuildingTacticModule):
         current_strategy: "Strategy",
         counter_ctx: "CounterContext",
     ) -> Optional[BuildingIdea]:
+        # Hard veto first: leave supply room for the composition's army
+        # target. Cheaper than scoring an idea we'd throw away.
+        profile = current_strategy.profile()
+        comp = profile.active_composition(heuristics.game_phase)
+        if comp is not None and comp.army_supply_target > 0:
+            max_worker_supply = 200 - comp.army_supply_target
+            if bot.supply_workers >= max_worker_supply:
+                return None
+
         confidence = 0.0
         evidence: dict = {}
 
-
-      
-        # Sub-signal: saturation delta — how many workers are still needed
+        # Sub-signal: saturation delta — how many workers are still needed.
+        # is_applicable already rejected delta <= 0.
         delta = heuristics.saturation_delta
-        if delta <= 0:
-            log.debug(
-                "ZergWorkerProductionTactic: fully saturated (delta=%.1f) — returning None",
-                delta,
-                frame=bot.state.game_loop,
-            )
-            return None  # fully saturated, don't queue more drones
         sat_sig = min(0.6, delta * 0.12)
         confidence += sat_sig
         evidence["saturation_delta"] = sat_sig
@@ -333,31 +601,25 @@ class ZergWorkerProductionTactic(BuildingTacticModule):
             evidence["early_game_boost"] = early_boost
 
         # Sub-signal: strategy drone bias — explicit per-strategy drone priority
-        profile = current_strategy.profile()
         if profile.drone_bias != 0.0:
             confidence += profile.drone_bias
             evidence["drone_bias"] = profile.drone_bias
 
-        comp = profile.active_composition(heuristics.game_phase)
-        if comp is not None and comp.army_supply_target > 0:
-            max_worker_supply = 200 - comp.army_supply_target
-            if bot.supply_workers >= max_worker_supply:
-                return None  # leave supply room for army target    
-
-        log.debug(
-            "ZergWorkerProductionTactic: confidence=%.3f (sat=%.3f econ_lag=%.3f early=%.3f drone_bias=%.3f delta=%.1f)",
-            confidence,
-            sat_sig,
-            evidence.get("economic_health_lag", 0.0),
-            evidence.get("early_game_boost", 0.0),
-            evidence.get("drone_bias", 0.0),
-            delta,
-            frame=bot.state.game_loop,
-        )
-
         if confidence < 0.15:
             return None
 
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(
+                "ZergWorkerProductionTactic: confidence=%.3f (sat=%.3f econ_lag=%.3f early=%.3f drone_bias=%.3f delta=%.1f)",
+                confidence,
+                sat_sig,
+                evidence.get("economic_health_lag", 0.0),
+                evidence.get("early_game_boost", 0.0),
+                evidence.get("drone_bias", 0.0),
+                delta,
+                frame=bot.state.game_loop,
+            )
+
         return BuildingIdea(
             building_module=self,
             action=BuildingAction.TRAIN,
@@ -377,7 +639,7 @@ class ZergWorkerProductionTactic(BuildingTacticModule):
 # Priority-ordered list of Zerg army units and the structures that make them.
 # Used for two purposes:
 #   1. Fallback when composition targeting returns nothing (ordered: cheapest first).
-#   2. `can_train` guard in _pick_by_composition / counter-play override.
+#   2. `can_train` guard in _scan_composition / counter-play override.
 #
 # IMPORTANT: In SC2 all larva-produced units can be trained from ANY hatchery-class
 # structure (HATCHERY, LAIR, or HIVE) — the producing structure is just the anchor
@@ -435,6 +697,20 @@ _ARMY_PRIORITY: List[tuple[UnitID, UnitID]] = [
     (UnitID.ULTRALISK,   UnitID.HIVE),
 ]
 
+# _ARMY_PRIORITY partitioned by producing structure, priority order preserved.
+# Lets _pick_unit walk only the entries for the building in hand instead of
+# skipping past every other structure's rows.  _STRUCTURES_BY_UNIT is the
+# reverse index, used for "can this building train X?" membership checks.
+_ARMY_PRIORITY_BY_STRUCTURE: dict[UnitID, tuple[UnitID, ...]] = {}
+_STRUCTURES_BY_UNIT: dict[UnitID, frozenset] = {}
+for _unit, _structure in _ARMY_PRIORITY:
+    _ARMY_PRIORITY_BY_STRUCTURE[_structure] = (
+        _ARMY_PRIORITY_BY_STRUCTURE.get(_structure, ()) + (_unit,)
+    )
+    _STRUCTURES_BY_UNIT[_unit] = (
+        _STRUCTURES_BY_UNIT.get(_unit, frozenset()) | {_structure}
+    )
+
 # When composition wants a gas-requiring unit but we're temporarily gas-starved,
 # don't immediately fall back to zergling spam — hold the larva so resources
 # accumulate for the correct unit.  Only override this patience and build cheap
@@ -472,15 +748,17 @@ class ZergArmyProductionTactic(BuildingTacticModule):
     })
 
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
-            return False
-        if not self._building_is_ready(building):
+        if not _is_townhall(building.type_id):
             return False
-        if not self._building_is_idle(building):
+        # Bot-wide gates first: when supply-blocked these reject every
+        # townhall without touching per-building state.
+        if bot.supply_left < 2:
             return False
         if bot.current_strategy in self.blocked_strategies:
             return False
-        if bot.supply_left < 2:
+        if not self._building_is_ready(building):
+            return False
+        if not self._building_is_idle(building):
             return False
         return True
 
@@ -495,35 +773,27 @@ class ZergArmyProductionTactic(BuildingTacticModule):
         confidence = 0.0
         evidence: dict = {}
 
-        # Determine which unit we'd want to train
-        train_type = self._pick_unit(building, bot, current_strategy, heuristics, counter_ctx)
-        if train_type is None:
-            log.debug(
-                "ZergArmyProductionTactic: no affordable/available unit for %s",
-                building.type_id.name,
-                frame=bot.state.game_loop,
-            )
-            return None  # can't afford or don't have tech for anything
+        # Resolved once here and shared with _pick_unit, rather than each
+        # looking up the strategy's active composition separately.
+        profile = current_strategy.profile()
+        comp = profile.active_composition(heuristics.game_phase)
 
         # --- EMERGENCY FLOOR: always build a minimum army ---
         # Count combat supply (exclude workers, queens, overlords)
-        WORKER_AND_SUPPORT = {
-            UnitID.DRONE, UnitID.QUEEN, UnitID.OVERLORD,
-            UnitID.OVERSEER, UnitID.OVERLORDCOCOON,
-        }
-        combat_units = bot.units.exclude_type(WORKER_AND_SUPPORT)
-        combat_supply = sum(SUPPLY_COST.get(u.type_id, 2) for u in combat_units)
-
-        log.debug(
-            "ZergArmyProductionTactic: combat_supply=%d min_floor=%d train_type=%s",
-            combat_supply,
-            _MIN_ARMY_SUPPLY,
-            train_type.name,
-            frame=bot.state.game_loop,
-        )
+        combat_supply = _combat_supply(bot)
 
         if combat_supply < _MIN_ARMY_SUPPLY:
             # Emergency mode: build army NOW regardless of strategy
+            train_type = self._pick_unit(building, bot, comp, counter_ctx)
+            if train_type is None:
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergArmyProductionTactic: no affordable/available unit for %s",
+                        building.type_id.name,
+                        frame=bot.state.game_loop,
+                    )
+                return None  # can't afford or don't have tech for anything
+
             confidence = 0.85
             evidence["emergency_army_floor"] = 0.85
             evidence["combat_supply"] = combat_supply
@@ -542,15 +812,14 @@ class ZergArmyProductionTactic(BuildingTacticModule):
             # Each strategy's composition curve declares an army_supply_target.
             # Once we reach it, defer to drone production (let drones win the
             # confidence race) instead of continuously pumping army.
-            profile = current_strategy.profile()
-            comp = profile.active_composition(heuristics.game_phase)
             if comp is not None and comp.army_supply_target > 0:
                 if combat_supply >= comp.army_supply_target:
-                    log.debug(
-                        "ZergArmyProductionTactic: army at target (%d/%d) — deferring to drones",
-                        combat_supply, comp.army_supply_target,
-                        frame=bot.state.game_loop,
-                    )
+                    if log.is_enabled_for(logging.DEBUG):
+                        log.debug(
+                            "ZergArmyProductionTactic: army at target (%d/%d) — deferring to drones",
+                            combat_supply, comp.army_supply_target,
+                            frame=bot.state.game_loop,
+                        )
                     return None  # larva should go to drones/overlords instead
 
             # --- Normal production scoring ---
@@ -580,12 +849,13 @@ class ZergArmyProductionTactic(BuildingTacticModule):
 
             # Sub-signal: resource pressure manager (overbanking override)
             rp = getattr(bot, 'resource_pressure', None)
+            in_panic = False
             if rp is not None:
-                boost = rp.army_production_boost(bot)
+                boost, in_panic = rp.army_pressure(bot)
                 if boost > 0:
                     confidence += boost
                     evidence['mineral_pressure'] = round(boost, 3)
-                if rp.is_panic_mode(bot):
+                if in_panic:
                     confidence = max(confidence, 0.92)
                     evidence['panic_mode'] = 0.92
 
@@ -598,9 +868,6 @@ class ZergArmyProductionTactic(BuildingTacticModule):
             # accumulate for expansion.  Combines the strategy's static
             # baseline with a dynamic boost from LDM overflow pressure.
             # Skipped during resource panic_mode (massive float → spend it).
-            in_panic = (
-                rp is not None and rp.is_panic_mode(bot)
-            )
             if not in_panic:
                 ldm_pressure = getattr(bot, "_ldm_pressure", 0)
                 effective_bank_bias = (
@@ -611,23 +878,37 @@ class ZergArmyProductionTactic(BuildingTacticModule):
                     confidence -= bank_pen
                     evidence["bank_penalty"] = -round(bank_pen, 3)
 
-            log.debug(
-                "ZergArmyProductionTactic: confidence=%.3f (base=%.2f agg=%.2f "
-                "behind=%.2f float=%.2f mineral_pressure=%.3f bank_pen=%.3f) train=%s avr=%.2f",
-                confidence,
-                _ARMY_BASE_CONFIDENCE,
-                agg_sig,
-                evidence.get("army_value_behind", 0.0),
-                evidence.get("mineral_float_pressure", 0.0),
-                evidence.get("mineral_pressure", 0.0),
-                evidence.get("bank_penalty", 0.0),
-                train_type.name,
-                avr,
-                frame=bot.state.game_loop,
-            )
+            if confidence < 0.15:
+                return None
 
-        if confidence < 0.15:
-            return None
+            # Unit selection walks the composition/priority tables and
+            # queries tech and cost per candidate, so it runs only once the
+            # idea is known to clear the confidence floor.
+            train_type = self._pick_unit(building, bot, comp, counter_ctx)
+            if train_type is None:
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergArmyProductionTactic: no affordable/available unit for %s",
+                        building.type_id.name,
+                        frame=bot.state.game_loop,
+                    )
+                return None  # can't afford or don't have tech for anything
+
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergArmyProductionTactic: confidence=%.3f (base=%.2f agg=%.2f "
+                    "behind=%.2f float=%.2f mineral_pressure=%.3f bank_pen=%.3f) train=%s avr=%.2f",
+                    confidence,
+                    _ARMY_BASE_CONFIDENCE,
+                    agg_sig,
+                    evidence.get("army_value_behind", 0.0),
+                    evidence.get("mineral_float_pressure", 0.0),
+                    evidence.get("mineral_pressure", 0.0),
+                    evidence.get("bank_penalty", 0.0),
+                    train_type.name,
+                    avr,
+                    frame=bot.state.game_loop,
+                )
 
         return BuildingIdea(
             building_module=self,
@@ -641,13 +922,15 @@ class ZergArmyProductionTactic(BuildingTacticModule):
         self,
         building: "Unit",
         bot: "ManifestorBot",
-        current_strategy: "Strategy",
-        heuristics: "HeuristicState",
+        target,
         counter_ctx=None,
     ) -> Optional[UnitID]:
         """
         Return the best unit type to train, preferring composition targets if available.
 
+        ``target`` is the strategy's active CompositionTarget (or None), as
+        already resolved by generate_idea.
+
         FIX: Previously just returned the first affordable unit in priority order,
         which meant zerglings were always chosen over roaches even when we needed roaches.
         Now checks composition targets and picks the most-underrepresented affordable type.
@@ -658,35 +941,29 @@ class ZergArmyProductionTactic(BuildingTacticModule):
         if counter_ctx and counter_ctx.priority_train_types:
             for unit_type in counter_ctx.priority_train_types:
                 # Check this unit can be trained from this building
-                can_train = any(
-                    structure == building.type_id
-                    for u, structure in _ARMY_PRIORITY
-                    if u == unit_type
-                )
-                if not can_train:
+                if building.type_id not in _STRUCTURES_BY_UNIT.get(unit_type, ()):
                     continue
-                if not bot.can_afford(unit_type):
+                if not _can_afford_unit(unit_type, bot):
                     continue
-                if bot.tech_requirement_progress(unit_type) < 1.0:
+                if _tech_progress(unit_type, bot) < 1.0:
                     continue
-                log.debug(
-                    "ZergArmyProductionTactic: counter-prescribed pick=%s",
-                    unit_type.name, frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergArmyProductionTactic: counter-prescribed pick=%s",
+                        unit_type.name, frame=bot.state.game_loop,
+                    )
                 return unit_type
 
-        profile = current_strategy.profile()
-        target = profile.active_composition(heuristics.game_phase)
-
         # If we have a composition target, try to satisfy it
         if target and target.ratios:
-            best_type = self._pick_by_composition(building, bot, target)
+            best_type, blocked = self._scan_composition(building, bot, target)
             if best_type is not None:
-                log.debug(
-                    "ZergArmyProductionTactic: composition-driven pick=%s",
-                    best_type.name,
-                    frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergArmyProductionTactic: composition-driven pick=%s",
+                        best_type.name,
+                        frame=bot.state.game_loop,
+                    )
                 return best_type
 
             # Composition returned nothing — all wanted units either lack tech or
@@ -696,171 +973,100 @@ class ZergArmyProductionTactic(BuildingTacticModule):
             # hold the larva rather than cementing the zergling-dominant army further.
             # Exception: if minerals are already piling up past the float threshold,
             # build cheap filler rather than wasting income completely.
-            blocked = self._wanted_unit_blocked_by_resources(building, bot, target)
             if blocked is not None:
                 if bot.minerals < _COMPOSITION_MINERAL_FLOAT_THRESHOLD:
+                    if log.is_enabled_for(logging.DEBUG):
+                        log.debug(
+                            "ZergArmyProductionTactic: holding larva for %s "
+                            "(tech ready, resource-constrained; min=%d gas=%d threshold=%d)",
+                            blocked.name,
+                            bot.minerals,
+                            bot.vespene,
+                            _COMPOSITION_MINERAL_FLOAT_THRESHOLD,
+                            frame=bot.state.game_loop,
+                        )
+                    return None
+                if log.is_enabled_for(logging.DEBUG):
                     log.debug(
-                        "ZergArmyProductionTactic: holding larva for %s "
-                        "(tech ready, resource-constrained; min=%d gas=%d threshold=%d)",
-                        blocked.name,
+                        "ZergArmyProductionTactic: mineral float (min=%d >= %d) — "
+                        "allowing cheap filler despite wanting %s",
                         bot.minerals,
-                        bot.vespene,
                         _COMPOSITION_MINERAL_FLOAT_THRESHOLD,
+                        blocked.name,
                         frame=bot.state.game_loop,
                     )
-                    return None
-                log.debug(
-                    "ZergArmyProductionTactic: mineral float (min=%d >= %d) — "
-                    "allowing cheap filler despite wanting %s",
-                    bot.minerals,
-                    _COMPOSITION_MINERAL_FLOAT_THRESHOLD,
-                    blocked.name,
-                    frame=bot.state.game_loop,
-                )
 
         # Fallback: priority list
-        for unit_type, structure_type in _ARMY_PRIORITY:
-            if building.type_id != structure_type:
+        for unit_type in _ARMY_PRIORITY_BY_STRUCTURE.get(building.type_id, ()):
+            if not _can_afford_unit(unit_type, bot):
                 continue
-            if not bot.can_afford(unit_type):
-                continue
-            if bot.tech_requirement_progress(unit_type) < 1.0:
-                log.debug(
-                    "ZergArmyProductionTactic: %s tech not ready (%.2f)",
-                    unit_type.name,
-                    bot.tech_requirement_progress(unit_type),
-                    frame=bot.state.game_loop,
-                )
+            tech = _tech_progress(unit_type, bot)
+            if tech < 1.0:
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergArmyProductionTactic: %s tech not ready (%.2f)",
+                        unit_type.name,
+                        tech,
+                        frame=bot.state.game_loop,
+                    )
                 continue
             return unit_type
         return None
 
-    def _pick_by_composition(
+    def _scan_composition(
         self,
         building: "Unit",
         bot: "ManifestorBot",
         target,
-    ) -> Optional[UnitID]:
+    ) -> tuple[Optional[UnitID], Optional[UnitID]]:
         """
-        Pick the unit type that is most underrepresented vs the composition target.
-        Only considers types that are affordable and have tech available.
+        Single pass over the composition target, returning ``(best, blocked)``.
+
+        ``best`` is the most under-represented unit type that is affordable and
+        has tech available.  ``blocked`` is the most under-represented type
+        whose tech is ready but which cannot be afforded right now — used by
+        _pick_unit to decide whether to hold larva instead of defaulting to
+        cheap zergling spam while waiting for gas/minerals to accumulate.
+
+        Both only consider types trainable from this building (_ARMY_PRIORITY).
+        A type whose tech isn't ready is neither: that is a structure problem,
+        not a resource one, and is handled elsewhere.
         """
-        WORKER_AND_SUPPORT = {
-            UnitID.DRONE, UnitID.QUEEN, UnitID.OVERLORD,
-            UnitID.OVERSEER, UnitID.OVERLORDCOCOON,
-        }
-        # Calculate current army supply per type
-        total_combat_supply = 0
-        supply_by_type: dict[UnitID, int] = {}
-        for unit in bot.units.exclude_type(WORKER_AND_SUPPORT):
-            cost = SUPPLY_COST.get(unit.type_id, 2)
-            supply_by_type[unit.type_id] = supply_by_type.get(unit.type_id, 0) + cost
-            total_combat_supply += cost
+        # Current army supply per type
+        total_combat_supply, supply_by_type = _army_supply_snapshot(bot)
 
         if total_combat_supply == 0:
             total_combat_supply = 1  # avoid div-by-zero
 
-        # Identify which hatchery types map to valid army units
-        valid_structure_types = {
-            UnitID.HATCHERY, UnitID.LAIR, UnitID.HIVE
-        }
-        if building.type_id not in valid_structure_types:
-            return None
-
-        # Find the most under-represented affordable type.
-        # Sentinel starts at 0.0 — only units with a POSITIVE deficit (i.e. genuinely
+        # Sentinels start at 0.0 — only units with a POSITIVE deficit (i.e. genuinely
         # underrepresented) can win.  A negative deficit means we already have too many
         # of that type and should never pick it here, even as a last resort.
-        best_type = None
+        best_type: Optional[UnitID] = None
         best_deficit = 0.0
+        best_blocked: Optional[UnitID] = None
+        blocked_deficit = 0.0
 
         for unit_type, ratio in target.ratios.items():
-            if unit_type in WORKER_AND_SUPPORT:
+            if unit_type in _WORKER_AND_SUPPORT:
                 continue
             # Check this unit can be trained from a hatchery-class structure.
             # After the _ARMY_PRIORITY fix every larva-produceable unit lists
             # HATCHERY so this correctly rejects morph-only units (LURKERMP, etc.).
-            can_train = any(
-                structure == building.type_id
-                for u, structure in _ARMY_PRIORITY
-                if u == unit_type
-            )
-            if not can_train:
-                continue
-            if not bot.can_afford(unit_type):
-                continue
-            if bot.tech_requirement_progress(unit_type) < 1.0:
-                continue
-
-            current_fraction = supply_by_type.get(unit_type, 0) / total_combat_supply
-            deficit = ratio - current_fraction
-            if deficit > best_deficit:
-                best_deficit = deficit
-                best_type = unit_type
-
-        return best_type
-
-    def _wanted_unit_blocked_by_resources(
-        self,
-        building: "Unit",
-        bot: "ManifestorBot",
-        target,
-    ) -> Optional[UnitID]:
-        """
-        Return the highest-deficit composition unit that:
-          - can be trained from this building type (is in _ARMY_PRIORITY)
-          - has tech fully unlocked (tech_requirement_progress >= 1.0)
-          - cannot currently be afforded (minerals or gas short)
-
-        Returns None if no such unit exists (either tech isn't ready yet, or
-        everything is affordable — meaning _pick_by_composition should have caught it).
-
-        Used by _pick_unit to decide whether to hold larva instead of defaulting
-        to cheap zergling spam while waiting for gas/minerals to accumulate.
-        """
-        WORKER_AND_SUPPORT = {
-            UnitID.DRONE, UnitID.QUEEN, UnitID.OVERLORD,
-            UnitID.OVERSEER, UnitID.OVERLORDCOCOON,
-        }
-        total_combat_supply = sum(
-            SUPPLY_COST.get(u.type_id, 2)
-            for u in bot.units.exclude_type(WORKER_AND_SUPPORT)
-        ) or 1
-        supply_by_type: dict[UnitID, int] = {}
-        for unit in bot.units.exclude_type(WORKER_AND_SUPPORT):
-            cost = SUPPLY_COST.get(unit.type_id, 2)
-            supply_by_type[unit.type_id] = supply_by_type.get(unit.type_id, 0) + cost
-
-        best_blocked: Optional[UnitID] = None
-        best_deficit: float = 0.0
-
-        for unit_type, ratio in target.ratios.items():
-            if unit_type in WORKER_AND_SUPPORT:
+            if building.type_id not in _STRUCTURES_BY_UNIT.get(unit_type, ()):
                 continue
-            # Must be trainable from this building type
-            can_train = any(
-                structure == building.type_id
-                for u, structure in _ARMY_PRIORITY
-                if u == unit_type
-            )
-            if not can_train:
-                continue
-            # Tech must be unlocked — if tech isn't ready yet this isn't a
-            # resource problem, it's a structure problem (handled elsewhere).
-            if bot.tech_requirement_progress(unit_type) < 1.0:
-                continue
-            # Must NOT be affordable — if it were, _pick_by_composition would have
-            # selected it already.
-            if bot.can_afford(unit_type):
+            if _tech_progress(unit_type, bot) < 1.0:
                 continue
 
-            current_fraction = supply_by_type.get(unit_type, 0) / total_combat_supply
-            deficit = ratio - current_fraction
-            if deficit > best_deficit:
-                best_deficit = deficit
+            deficit = ratio - supply_by_type.get(unit_type, 0) / total_combat_supply
+            if _can_afford_unit(unit_type, bot):
+                if deficit > best_deficit:
+                    best_deficit = deficit
+                    best_type = unit_type
+            elif deficit > blocked_deficit:
+                blocked_deficit = deficit
                 best_blocked = unit_type
 
-        return best_blocked
+        return best_type, best_blocked
 
     def execute(self, building: "Unit", idea: BuildingIdea, bot: "ManifestorBot") -> bool:
         result = self._execute_train(building, idea, bot)
@@ -911,6 +1117,18 @@ _UPGRADE_PRIORITY: List[tuple[UpgradeId, UnitID]] = [
     (UpgradeId.ZERGGROUNDARMORSLEVEL3,  UnitID.EVOLUTIONCHAMBER),
 ]
 
+# _UPGRADE_PRIORITY partitioned by researching structure, priority order preserved.
+_UPGRADE_PRIORITY_BY_STRUCTURE: dict[UnitID, tuple[UpgradeId, ...]] = {}
+_STRUCTURES_BY_UPGRADE: dict[UpgradeId, frozenset] = {}
+for _upgrade, _structure in _UPGRADE_PRIORITY:
+    _UPGRADE_PRIORITY_BY_STRUCTURE[_structure] = (
+        _UPGRADE_PRIORITY_BY_STRUCTURE.get(_structure, ()) + (_upgrade,)
+    )
+    _STRUCTURES_BY_UPGRADE[_upgrade] = (
+        _STRUCTURES_BY_UPGRADE.get(_upgrade, frozenset()) | {_structure}
+    )
+del _unit, _upgrade, _structure
+
 # Minimum number of alive benefiting units required before we research an upgrade.
 # An upgrade not listed here has no threshold (always research when affordable).
 #
@@ -1009,6 +1227,13 @@ class ZergUpgradeResearchTactic(BuildingTacticModule):
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
         if building.type_id not in self.BUILDING_TYPES:
             return False
+        # Structures with nothing in _UPGRADE_PRIORITY (hydra den, spire, ...)
+        # can never yield an upgrade — counter-prescribed ones are also
+        # filtered through _STRUCTURES_BY_UPGRADE — so stop here.
+        if building.type_id not in _UPGRADE_PRIORITY_BY_STRUCTURE:
+            return False
+        if building.type_id in bot._upgrade_structures_done:
+            return False
         if not self._building_is_ready(building):
             return False
         if not self._building_is_idle(building):
@@ -1025,11 +1250,12 @@ class ZergUpgradeResearchTactic(BuildingTacticModule):
     ) -> Optional[BuildingIdea]:
         upgrade = self._pick_upgrade(building, bot, counter_ctx)
         if upgrade is None:
-            log.debug(
-                "ZergUpgradeResearchTactic: no applicable upgrade for %s",
-                building.type_id.name,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergUpgradeResearchTactic: no applicable upgrade for %s",
+                    building.type_id.name,
+                    frame=bot.state.game_loop,
+                )
             return None
 
         confidence = 0.75
@@ -1050,19 +1276,20 @@ class ZergUpgradeResearchTactic(BuildingTacticModule):
             confidence -= bank_pen
             evidence["bank_penalty"] = -round(bank_pen, 3)
 
-        log.debug(
-            "ZergUpgradeResearchTactic: %s → researching %s (conf=%.2f bank_pen=%.3f)",
-            building.type_id.name,
-            upgrade.name,
-            confidence,
-            evidence.get("bank_penalty", 0.0),
-            frame=bot.state.game_loop,
-        )
-
-        return BuildingIdea(
-            building_module=self,
-            action=BuildingAction.RESEARCH,
-            confidence=confidence,
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(
+                "ZergUpgradeResearchTactic: %s → researching %s (conf=%.2f bank_pen=%.3f)",
+                building.type_id.name,
+                upgrade.name,
+                confidence,
+                evidence.get("bank_penalty", 0.0),
+                frame=bot.state.game_loop,
+            )
+
+        return BuildingIdea(
+            building_module=self,
+            action=BuildingAction.RESEARCH,
+            confidence=confidence,
             evidence=evidence,
             upgrade=upgrade,
         )
@@ -1073,11 +1300,7 @@ class ZergUpgradeResearchTactic(BuildingTacticModule):
         # Spines against heavy bio) even before we have many benefiting units.
         if counter_ctx and counter_ctx.priority_upgrades:
             for upgrade in counter_ctx.priority_upgrades:
-                match = any(
-                    u == upgrade and s == building.type_id
-                    for u, s in _UPGRADE_PRIORITY
-                )
-                if not match:
+                if building.type_id not in _STRUCTURES_BY_UPGRADE.get(upgrade, ()):
                     continue
                 if self._already_researched(upgrade, bot):
                     continue
@@ -1085,37 +1308,44 @@ class ZergUpgradeResearchTactic(BuildingTacticModule):
                     continue
                 if not self._can_afford_research(upgrade, bot):
                     continue
-                log.debug(
-                    "ZergUpgradeResearchTactic: counter-prescribed %s",
-                    upgrade.name, frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergUpgradeResearchTactic: counter-prescribed %s",
+                        upgrade.name, frame=bot.state.game_loop,
+                    )
                 return upgrade
 
         # Fall through to normal priority list
-        for upgrade, structure_type in _UPGRADE_PRIORITY:
-            if building.type_id != structure_type:
-                continue
+        candidates = _UPGRADE_PRIORITY_BY_STRUCTURE.get(building.type_id, ())
+        if all(self._already_researched(u, bot) for u in candidates):
+            # Everything this structure type offers is done — retire it so
+            # is_applicable rejects it from now on.
+            bot._upgrade_structures_done.add(building.type_id)
+            return None
+        for upgrade in candidates:
             if self._already_researched(upgrade, bot):
                 continue
             if self._is_being_researched(upgrade, bot):
                 continue
             if not self._can_afford_research(upgrade, bot):
-                log.debug(
-                    "ZergUpgradeResearchTactic: cannot afford %s (minerals=%d vespene=%d)",
-                    upgrade.name,
-                    bot.minerals,
-                    bot.vespene,
-                    frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergUpgradeResearchTactic: cannot afford %s (minerals=%d vespene=%d)",
+                        upgrade.name,
+                        bot.minerals,
+                        bot.vespene,
+                        frame=bot.state.game_loop,
+                    )
                 continue
             # Unit-count threshold: skip this upgrade if we don't yet have enough
             # alive benefiting units to justify the investment.
             if not self._meets_unit_threshold(upgrade, bot):
-                log.debug(
-                    "ZergUpgradeResearchTactic: deferring %s — not enough benefiting units yet",
-                    upgrade.name,
-                    frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergUpgradeResearchTactic: deferring %s — not enough benefiting units yet",
+                        upgrade.name,
+                        frame=bot.state.game_loop,
+                    )
                 continue
             return upgrade
         return None
@@ -1133,7 +1363,7 @@ class ZergUpgradeResearchTactic(BuildingTacticModule):
             return True  # no threshold defined — always allow
 
         min_units, beneficiary_types = entry
-        count = sum(bot.units(t).amount for t in beneficiary_types)
+        count = sum(len(_units_of(t, bot)) for t in beneficiary_types)
         return count >= min_units
 
     def execute(self, building: "Unit", idea: BuildingIdea, bot: "ManifestorBot") -> bool:
@@ -1165,6 +1395,35 @@ class ZergUpgradeResearchTactic(BuildingTacticModule):
 # ---------------------------------------------------------------------------
 
 _RALLY_STALE_DISTANCE = 5.0
+_RALLY_STALE_DISTANCE_SQ = _RALLY_STALE_DISTANCE * _RALLY_STALE_DISTANCE
+
+def _army_centroid(bot) -> Point2:
+    """
+    Mean position of non-worker, non-supply units, or the start location.
+
+    Every townhall's rally check needs the same point; it is computed once
+    per frame.
+    """
+    cache = bot.frame_cache
+    if cache.army_centroid is not None:
+        return cache.army_centroid
+
+    # Walk the per-frame type index so the worker/supply exclusion is one
+    # test per type rather than one per unit.
+    skip = {bot.worker_type, bot.supply_type}
+    sx = sy = 0.0
+    n = 0
+    for unit_type, units in _units_by_type(bot).items():
+        if unit_type in skip:
+            continue
+        for unit in units:
+            x, y = unit.position
+            sx += x
+            sy += y
+        n += len(units)
+
+    cache.army_centroid = Point2((sx / n, sy / n)) if n else bot.start_location
+    return cache.army_centroid
 
 
 class ZergRallyTactic(BuildingTacticModule):
@@ -1178,19 +1437,40 @@ class ZergRallyTactic(BuildingTacticModule):
         UnitID.HIVE,
     })
 
+    # Built on first use — the set never changes, but Strategy can only be
+    # imported lazily here.
+    _blocked: Optional[frozenset] = None
+
     @property
     def blocked_strategies(self):
-        from ManifestorBot.manifests.strategy import Strategy
-        return frozenset({Strategy.DRONE_ONLY_FORTRESS})
+        blocked = ZergRallyTactic._blocked
+        if blocked is None:
+            from ManifestorBot.manifests.strategy import Strategy
+            blocked = ZergRallyTactic._blocked = frozenset({Strategy.DRONE_ONLY_FORTRESS})
+        return blocked
 
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        if not _is_townhall(building.type_id):
             return False
         if not self._building_is_ready(building):
             return False
         # Rally can be set even while the building is busy — it's non-disruptive.
         if bot.current_strategy in self.blocked_strategies:
             return False
+
+        # Check how stale the existing rally is. Doing it here rather than
+        # in generate_idea means townhalls whose rally is already aligned
+        # drop out at the cheap gate. The cache stores plain (x, y) tuples
+        # so this compares squared distances without building any Point2.
+        last_rally = bot._building_rally_cache.get(building.tag)
+        if last_rally is not None:
+            # Point2 is a tuple, so unpacking skips its .x/.y properties.
+            tx, ty = self._rally_target(bot)
+            lx, ly = last_rally
+            dx = tx - lx
+            dy = ty - ly
+            if dx * dx + dy * dy < _RALLY_STALE_DISTANCE_SQ:
+                return False  # Close enough — don't bother updating
         return True
 
     def generate_idea(
@@ -1201,29 +1481,22 @@ class ZergRallyTactic(BuildingTacticModule):
         current_strategy: "Strategy",
         counter_ctx: "CounterContext",
     ) -> Optional[BuildingIdea]:
-        target = self._compute_rally_target(bot, heuristics, current_strategy)
-
-        # Check how stale the existing rally is
-        cache: dict = getattr(bot, "_building_rally_cache", {})
-        last_rally = cache.get(building.tag)
-
-        if last_rally is not None:
-            dist = target.distance_to(last_rally)
-            if dist < _RALLY_STALE_DISTANCE:
-                return None  # Close enough — don't bother updating
+        target = self._rally_target(bot)
+        last_rally = bot._building_rally_cache.get(building.tag)
 
         confidence = 0.55  # medium confidence — rally correction is useful but not urgent
         evidence = {"rally_drift": "stale" if last_rally else "initial"}
 
-        log.debug(
-            "ZergRallyTactic: %s tag=%d setting rally to (%.0f, %.0f) (%s)",
-            building.type_id.name,
-            building.tag,
-            target.x,
-            target.y,
-            evidence["rally_drift"],
-            frame=bot.state.game_loop,
-        )
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(
+                "ZergRallyTactic: %s tag=%d setting rally to (%.0f, %.0f) (%s)",
+                building.type_id.name,
+                building.tag,
+                target.x,
+                target.y,
+                evidence["rally_drift"],
+                frame=bot.state.game_loop,
+            )
 
         return BuildingIdea(
             building_module=self,
@@ -1237,19 +1510,32 @@ class ZergRallyTactic(BuildingTacticModule):
         success = self._execute_rally(building, idea, bot)
         if success and idea.rally_point is not None:
             # Update cache so we don't spam this
-            if not hasattr(bot, "_building_rally_cache"):
-                bot._building_rally_cache = {}
-            bot._building_rally_cache[building.tag] = idea.rally_point
+            bot._building_rally_cache[building.tag] = (
+                idea.rally_point.x,
+                idea.rally_point.y,
+            )
         return success
 
+    def _rally_target(self, bot: "ManifestorBot") -> "Point2":
+        """
+        Rally target for the current frame, computed on first request.
+
+        The target only depends on bot-wide state (army centroid,
+        strategy), so each townhall only pays for its own staleness check.
+        """
+        cache = bot.frame_cache
+        if cache.rally_target is None:
+            cache.rally_target = self._compute_rally_target(
+                bot, bot.current_strategy
+            )
+        return cache.rally_target
+
     def _compute_rally_target(
         self,
         bot: "ManifestorBot",
-        heuristics: "HeuristicState",
         current_strategy: "Strategy",
     ) -> "Point2":
-        army = bot.units.exclude_type({bot.worker_type, bot.supply_type})
-        army_center = army.center if army else bot.start_location
+        army_center = _army_centroid(bot)
 
         if current_strategy.is_aggressive():
             enemy_base = bot.enemy_start_locations[0]
@@ -1269,6 +1555,11 @@ class ZergRallyTactic(BuildingTacticModule):
 # 4b. Hatchery Rebuild — replace destroyed townhalls
 # ---------------------------------------------------------------------------
 
+# A lost hatchery position counts as rebuilt once any townhall stands
+# within this radius of it.
+_REBUILD_DONE_RADIUS_SQ: float = 5.0 * 5.0
+
+
 class ZergHatcheryRebuildTactic(BuildingTacticModule):
     """
     Detects destroyed hatcheries tracked in bot._lost_hatchery_positions and
@@ -1281,7 +1572,7 @@ class ZergHatcheryRebuildTactic(BuildingTacticModule):
     BUILDING_TYPES = frozenset({UnitID.HATCHERY, UnitID.LAIR, UnitID.HIVE})
 
     def is_applicable(self, building, bot) -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        if not _is_townhall(building.type_id):
             return False
         if not self._building_is_ready(building):
             return False
@@ -1296,37 +1587,50 @@ class ZergHatcheryRebuildTactic(BuildingTacticModule):
         profile = current_strategy.profile()
         comp = profile.active_composition(heuristics.game_phase) if heuristics else None
         if comp is not None:
-            current_bases = bot.townhalls.amount + bot.already_pending(UnitID.HATCHERY)
+            current_bases = bot.townhalls.amount + _pending(UnitID.HATCHERY, bot)
             if current_bases >= comp.max_hatcheries:
-                log.debug(
-                    "ZergHatcheryRebuildTactic: at hatch cap (%d/%d) — skipping rebuild",
-                    current_bases, comp.max_hatcheries,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergHatcheryRebuildTactic: at hatch cap (%d/%d) — skipping rebuild",
+                        current_bases, comp.max_hatcheries,
+                        frame=bot.state.game_loop,
+                    )
                 return None
                 
-        # Remove positions where a townhall already exists (rebuild complete)
-        cleaned = [
-            pos for pos in lost
-            if not bot.townhalls.closer_than(5.0, pos)
-        ]
+        # Remove positions where a townhall already exists (rebuild complete).
+        # Townhall positions are read once; each lost spot is then a plain
+        # squared-distance test instead of a closer_than() Units build.
+        townhall_xy = [th.position for th in bot.townhalls]
+        cleaned = []
+        for pos in lost:
+            px, py = pos
+            for tx, ty in townhall_xy:
+                dx = tx - px
+                dy = ty - py
+                if dx * dx + dy * dy < _REBUILD_DONE_RADIUS_SQ:
+                    break
+            else:
+                cleaned.append(pos)
         bot._lost_hatchery_positions = cleaned
 
         if not cleaned:
             return None
 
         if bot.minerals < 500:
-            log.debug(
-                "ZergHatcheryRebuildTactic: minerals=%d < 500 — waiting for funds",
-                bot.minerals,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergHatcheryRebuildTactic: minerals=%d < 500 — waiting for funds",
+                    bot.minerals,
+                    frame=bot.state.game_loop,
+                )
             return None
 
         if bot.construction_queue.count_active_of_type(UnitID.HATCHERY) > 0:
-            log.debug(
-                "ZergHatcheryRebuildTactic: hatchery already in queue — skipping",
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergHatcheryRebuildTactic: hatchery already in queue — skipping",
+                    frame=bot.state.game_loop,
+                )
             return None
 
         confidence = 0.85
@@ -1415,7 +1719,7 @@ class ZergStructureBuildTactic(BuildingTacticModule):
     _last_enqueued_frame: int = -1
 
     def is_applicable(self, building, bot) -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        if not _is_townhall(building.type_id):
             return False
         if not self._building_is_ready(building):
             return False
@@ -1470,13 +1774,13 @@ class ZergStructureBuildTactic(BuildingTacticModule):
                 structure_type, prereq, min_minerals = urgent_structure
                 # Check prerequisite
                 can_build = True
-                if prereq and not bot.structures(prereq).ready:
+                if prereq and prereq not in _ready_structure_types(bot):
                     can_build = False  # Can't build yet — fall through to normal priority
                 if can_build and bot.minerals >= min_minerals:
-                    existing = bot.structures(structure_type).amount
+                    existing = len(_structures_of(structure_type, bot))
                     pending = bot.construction_queue.count_active_of_type(structure_type)
                     max_allowed = _max_for_structure(structure_type, bot)
-                    ares_pending = bot.already_pending(structure_type)
+                    ares_pending = _pending(structure_type, bot)
                     if existing + pending < max_allowed and existing + ares_pending < max_allowed:
                         confidence = 0.88  # above normal 0.80, below queen 0.97
                         evidence = {"counter_structure": structure_type.name, "urgent": True}
@@ -1492,43 +1796,87 @@ class ZergStructureBuildTactic(BuildingTacticModule):
                             train_type=structure_type,
                         )
 
+        structure_type = self._pick_priority_structure(bot)
+        if structure_type is None:
+            return None
+
+        confidence = 0.80
+        evidence = {"structure_priority": 0.80, "type": structure_type.name}
+
+        profile = current_strategy.profile()
+        agg = profile.engage_bias * 0.10
+        confidence += agg
+        evidence["strategy_agg"] = round(agg, 3)
+
+        log.info(
+            "ZergStructureBuildTactic: queuing %s (conf=%.2f minerals=%d)",
+            structure_type.name,
+            confidence,
+            bot.minerals,
+            frame=bot.state.game_loop,
+        )
+
+        return BuildingIdea(
+            building_module=self,
+            action=BuildingAction.TRAIN,
+            confidence=confidence,
+            evidence=evidence,
+            train_type=structure_type,
+        )
+
+    @classmethod
+    def _pick_priority_structure(cls, bot) -> Optional[UnitID]:
+        """
+        Return the first _STRUCTURE_PRIORITY entry that passes every gate.
+
+        Nothing in the walk depends on which hatchery is asking, so the
+        answer is cached per game-loop tick and shared by all townhalls.
+        execute() clears the cache after a successful enqueue so the
+        queue-pending counts are re-read.
+        """
+        cache = bot.frame_cache
+        if not cache.structure_pick_valid:
+            cache.structure_pick = cls._compute_priority_structure(bot)
+            cache.structure_pick_valid = True
+        return cache.structure_pick
+
+    @staticmethod
+    def _compute_priority_structure(bot) -> Optional[UnitID]:
         # ── Queen gate: precompute queen deficit once ──────────────────
         # Optional tech buildings (_QUEEN_GATED_STRUCTURES) are skipped until
         # the queen quota is fully met, so minerals aren't wasted on tech when
         # queens are still needed for defense/injects.
-        _hatch_count = bot.structures.filter(
-            lambda s: s.type_id in {UnitID.HATCHERY, UnitID.LAIR, UnitID.HIVE} and s.is_ready
-        ).amount
-        _queen_quota = max(_MIN_QUEENS, int(_hatch_count * _MAX_QUEENS_PER_HATCHERY))
-        _effective_queens = bot.units(UnitID.QUEEN).amount + bot.already_pending(UnitID.QUEEN)
+        _, _queens, _pending_queens, _queen_quota = _queen_status(bot)
+        _effective_queens = _queens + _pending_queens
         _queens_deficient = _effective_queens < _queen_quota
 
-        for structure_type, prerequisite, min_minerals in _STRUCTURE_PRIORITY:
-            # ── Queen gate: skip optional tech while queens are short ──
-            if _queens_deficient and structure_type in _QUEEN_GATED_STRUCTURES:
-                log.debug(
-                    "ZergStructureBuildTactic: %s gated — queens=%d < quota=%d",
-                    structure_type.name, _effective_queens, _queen_quota,
-                    frame=bot.state.game_loop,
-                )
-                continue
+        # One pass over the construction queue for all candidates.
+        queued = bot.construction_queue.counts_by_type()
 
-            # ── Army gate: skip tech buildings until minimum combat supply ──
-            if structure_type in _ARMY_GATED_STRUCTURES:
-                _WORKER_AND_SUPPORT = {
-                    UnitID.DRONE, UnitID.QUEEN, UnitID.OVERLORD,
-                    UnitID.OVERSEER, UnitID.OVERLORDCOCOON,
-                }
-                _combat_supply = sum(
-                    SUPPLY_COST.get(u.type_id, 2)
-                    for u in bot.units.exclude_type(_WORKER_AND_SUPPORT)
-                )
-                if _combat_supply < _MIN_ARMY_SUPPLY_FOR_TECH:
+        for (
+            structure_type, prerequisite, min_minerals,
+            queen_gated, army_gated, util_entry, static_max,
+        ) in _STRUCTURE_PRIORITY_ROWS:
+            # ── Queen gate: skip optional tech while queens are short ──
+            if _queens_deficient and queen_gated:
+                if log.is_enabled_for(logging.DEBUG):
                     log.debug(
-                        "ZergStructureBuildTactic: %s gated — combat_supply=%d < %d",
-                        structure_type.name, _combat_supply, _MIN_ARMY_SUPPLY_FOR_TECH,
+                        "ZergStructureBuildTactic: %s gated — queens=%d < quota=%d",
+                        structure_type.name, _effective_queens, _queen_quota,
                         frame=bot.state.game_loop,
                     )
+                continue
+
+            # ── Army gate: skip tech buildings until minimum combat supply ──
+            if army_gated:
+                combat_supply = _combat_supply(bot)
+                if combat_supply < _MIN_ARMY_SUPPLY_FOR_TECH:
+                    if log.is_enabled_for(logging.DEBUG):
+                        log.debug(
+                            "ZergStructureBuildTactic: %s gated — combat_supply=%d < %d",
+                            structure_type.name, combat_supply, _MIN_ARMY_SUPPLY_FOR_TECH,
+                            frame=bot.state.game_loop,
+                        )
                     continue
 
             # ── Hard cap on structure count ────────────────────────────
@@ -1537,21 +1885,23 @@ class ZergStructureBuildTactic(BuildingTacticModule):
             # there is a window between the ConstructionQueue pruning an order
             # (DONE state) and the structure appearing as ready where both
             # existing_count and pending_count can be 0, allowing a duplicate.
-            max_allowed = _max_for_structure(structure_type, bot)
-            existing_ready = bot.structures(structure_type).ready
-            existing_building = bot.structures(structure_type).filter(
-                lambda s: s.build_progress < 1.0
+            max_allowed = (
+                static_max if static_max is not None
+                else _max_for_structure(structure_type, bot)
             )
-            existing_count = existing_ready.amount + existing_building.amount
-            pending_count = bot.construction_queue.count_active_of_type(structure_type)
+            existing = _structures_of(structure_type, bot)
+            existing_ready = [s for s in existing if s.build_progress >= 1.0]
+            existing_count = len(existing)
+            pending_count = queued.get(structure_type, 0)
             total = existing_count + pending_count
 
             if total >= max_allowed:
-                log.debug(
-                    "ZergStructureBuildTactic: %s at cap (%d/%d) — skipping",
-                    structure_type.name, total, max_allowed,
-                    frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergStructureBuildTactic: %s at cap (%d/%d) — skipping",
+                        structure_type.name, total, max_allowed,
+                        frame=bot.state.game_loop,
+                    )
                 continue
 
             # Safety net: also check Ares' own tracking. When an order is
@@ -1559,44 +1909,46 @@ class ZergStructureBuildTactic(BuildingTacticModule):
             # a different worker), our queue loses track but already_pending
             # still counts the drone walking or morphing. This prevents
             # duplicate request_zerg_placement calls.
-            ares_pending = bot.already_pending(structure_type)
+            ares_pending = _pending(structure_type, bot)
             if existing_count + ares_pending >= max_allowed:
-                log.debug(
-                    "ZergStructureBuildTactic: %s at cap via already_pending (%d+%d/%d) — skipping",
-                    structure_type.name, existing_count, ares_pending, max_allowed,
-                    frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergStructureBuildTactic: %s at cap via already_pending (%d+%d/%d) — skipping",
+                        structure_type.name, existing_count, ares_pending, max_allowed,
+                        frame=bot.state.game_loop,
+                    )
                 continue
 
             # ── Per-structure utilization gate ─────────────────────────
             # Before building a structure, confirm we have enough supply
             # worth of the relevant units already alive.  Uses SUPPLY_COST
             # so zergling supply (0.5 each) is counted correctly.
-            util_entry = _STRUCTURE_UTILIZATION_GATE.get(structure_type)
             if util_entry is not None:
                 min_supply, beneficiary_types = util_entry
                 current_supply = _utilization_supply(beneficiary_types, bot)
                 if current_supply < min_supply:
-                    log.debug(
-                        "ZergStructureBuildTactic: %s deferred — need %.1f supply of %s, have %.1f",
-                        structure_type.name,
-                        min_supply,
-                        "/".join(t.name for t in beneficiary_types[:2]),
-                        current_supply,
-                        frame=bot.state.game_loop,
-                    )
+                    if log.is_enabled_for(logging.DEBUG):
+                        log.debug(
+                            "ZergStructureBuildTactic: %s deferred — need %.1f supply of %s, have %.1f",
+                            structure_type.name,
+                            min_supply,
+                            "/".join(t.name for t in beneficiary_types[:2]),
+                            current_supply,
+                            frame=bot.state.game_loop,
+                        )
                     continue
 
             # ── Utilization gate: only add more if existing are at capacity ──
             # Prevents duplicate research buildings (e.g. 2nd evo chamber) from
             # being built while the first one still has idle research slots.
-            if existing_ready.amount >= 1:
+            if existing_ready:
                 if not _building_at_capacity(structure_type, existing_ready, bot):
-                    log.debug(
-                        "ZergStructureBuildTactic: %s — existing not at capacity, deferring",
-                        structure_type.name,
-                        frame=bot.state.game_loop,
-                    )
+                    if log.is_enabled_for(logging.DEBUG):
+                        log.debug(
+                            "ZergStructureBuildTactic: %s — existing not at capacity, deferring",
+                            structure_type.name,
+                            frame=bot.state.game_loop,
+                        )
                     continue
 
             # Prerequisite check — with special handling for EXTRACTOR:
@@ -1605,66 +1957,49 @@ class ZergStructureBuildTactic(BuildingTacticModule):
             if prerequisite:
                 if structure_type == UnitID.EXTRACTOR:
                     # Accept pending OR ready pool
-                    pool_exists = bool(bot.structures(prerequisite))
-                    pool_pending = bot.already_pending(prerequisite) > 0
+                    pool_exists = bool(_structures_of(prerequisite, bot))
+                    pool_pending = _pending(prerequisite, bot) > 0
                     if not pool_exists and not pool_pending:
-                        log.debug(
-                            "ZergStructureBuildTactic: EXTRACTOR skipped — pool not started yet",
-                            frame=bot.state.game_loop,
-                        )
+                        if log.is_enabled_for(logging.DEBUG):
+                            log.debug(
+                                "ZergStructureBuildTactic: EXTRACTOR skipped — pool not started yet",
+                                frame=bot.state.game_loop,
+                            )
                         continue
                 else:
-                    if not bot.structures(prerequisite).ready:
-                        log.debug(
-                            "ZergStructureBuildTactic: %s skipped — %s not ready",
-                            structure_type.name,
-                            prerequisite.name,
-                            frame=bot.state.game_loop,
-                        )
+                    if prerequisite not in _ready_structure_types(bot):
+                        if log.is_enabled_for(logging.DEBUG):
+                            log.debug(
+                                "ZergStructureBuildTactic: %s skipped — %s not ready",
+                                structure_type.name,
+                                prerequisite.name,
+                                frame=bot.state.game_loop,
+                            )
                         continue
 
             if bot.minerals < min_minerals:
-                log.debug(
-                    "ZergStructureBuildTactic: %s skipped — minerals=%d < %d",
-                    structure_type.name,
-                    bot.minerals,
-                    min_minerals,
-                    frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergStructureBuildTactic: %s skipped — minerals=%d < %d",
+                        structure_type.name,
+                        bot.minerals,
+                        min_minerals,
+                        frame=bot.state.game_loop,
+                    )
                 continue
 
-            if bot.tech_requirement_progress(structure_type) < 0.85:
-                log.debug(
-                    "ZergStructureBuildTactic: %s tech not ready (%.2f)",
-                    structure_type.name,
-                    bot.tech_requirement_progress(structure_type),
-                    frame=bot.state.game_loop,
-                )
+            tech = _tech_progress(structure_type, bot)
+            if tech < 0.85:
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergStructureBuildTactic: %s tech not ready (%.2f)",
+                        structure_type.name,
+                        tech,
+                        frame=bot.state.game_loop,
+                    )
                 continue
 
-            confidence = 0.80
-            evidence = {"structure_priority": 0.80, "type": structure_type.name}
-
-            profile = current_strategy.profile()
-            agg = profile.engage_bias * 0.10
-            confidence += agg
-            evidence["strategy_agg"] = round(agg, 3)
-
-            log.info(
-                "ZergStructureBuildTactic: queuing %s (conf=%.2f minerals=%d)",
-                structure_type.name,
-                confidence,
-                bot.minerals,
-                frame=bot.state.game_loop,
-            )
-
-            return BuildingIdea(
-                building_module=self,
-                action=BuildingAction.TRAIN,
-                confidence=confidence,
-                evidence=evidence,
-                train_type=structure_type,
-            )
+            return structure_type
 
         return None
 
@@ -1698,6 +2033,7 @@ class ZergStructureBuildTactic(BuildingTacticModule):
         accepted = bot.construction_queue.enqueue(order)
         if accepted:
             ZergStructureBuildTactic._last_enqueued_frame = bot.state.game_loop
+            bot.frame_cache.structure_pick_valid = False
             log.game_event(
                 "BUILD_ENQUEUED",
                 f"{idea.train_type.name} near {base_location}",
@@ -1737,6 +2073,66 @@ class ZergStructureBuildTactic(BuildingTacticModule):
         - At least one existing base is approaching mineral saturation, so the
           expansion actually serves a purpose.
         """
+        # Cheap bot-wide gates run first; most ticks end here, before the
+        # strategy profile or any townhall iteration is touched.
+        ldm_pressure = getattr(bot, "_ldm_pressure", 0)
+
+        # Mineral gate.
+        # Under LDM pressure halve the threshold (300 → 150): workers are
+        # already out there mining, so queue the expansion the moment we can
+        # afford it rather than waiting to bank up further.
+        effective_mineral_threshold = (
+            self._EXPAND_MIN_MINERALS // 2 if ldm_pressure > 0
+            else self._EXPAND_MIN_MINERALS
+        )
+        if bot.minerals < effective_mineral_threshold:
+            return None
+
+        # Hard gate: don't queue another expansion while ANY hatchery order
+        # is in flight — our queue OR a drone actively en route to build one.
+        # This prevents the MorphTracker DONE→prune gap from causing double queues.
+        # bot.already_pending(HATCHERY) catches any drone that has a build
+        # order but hasn't started morphing yet (worker en route).
+        hatch_morphing = _pending(UnitID.HATCHERY, bot)
+        if hatch_morphing > 0:
+            return None
+        if bot.construction_queue.count_active_of_type(UnitID.HATCHERY) > 0:
+            return None
+
+        # Everything past the gates above reads frame-constant state plus
+        # the mineral bank, so later townhalls in the same tick replay the
+        # first one's verdict instead of re-running the defend and
+        # saturation checks.
+        cache = bot.frame_cache
+        minerals = bot.minerals
+        memo = cache.expand_memo
+        if memo is None or memo[0] != minerals:
+            memo = cache.expand_memo = (
+                minerals,
+                self._expand_decision(
+                    bot, heuristics, current_strategy, hatch_morphing, ldm_pressure,
+                ),
+            )
+        if memo[1] is None:
+            return None
+
+        confidence, evidence = memo[1]
+        return BuildingIdea(
+            building_module=self,
+            action=BuildingAction.TRAIN,
+            confidence=confidence,
+            evidence=dict(evidence),
+            train_type=UnitID.HATCHERY,
+        )
+
+    def _expand_decision(
+        self, bot, heuristics, current_strategy, hatch_morphing, ldm_pressure
+    ) -> Optional[tuple[float, dict]]:
+        """
+        The strategy, drone, defence and saturation gates of _maybe_expand().
+
+        Returns (confidence, evidence) for an expansion idea, or None.
+        """
         profile = current_strategy.profile()
         comp = profile.active_composition(heuristics.game_phase)
         if comp is None:
@@ -1746,53 +2142,31 @@ class ZergStructureBuildTactic(BuildingTacticModule):
 
         # Count all townhalls — ready + morphing — so we don't double-queue.
         # bot.townhalls includes under-construction hatcheries.
-        # bot.already_pending(HATCHERY) catches any drone that has a build
-        # order but hasn't started morphing yet (worker en route).
-        hatch_morphing = bot.already_pending(UnitID.HATCHERY)
         current_bases = bot.townhalls.amount + hatch_morphing
 
         # LDM pressure means workers are overflowing every current base and
         # are mining remotely — concrete proof we need another hatchery.
         # Allow one extra expansion beyond the strategy's phase cap so we
         # don't get stuck waiting for a strategy switch to unlock it.
-        ldm_pressure = getattr(bot, "_ldm_pressure", 0)
         effective_max_hatch = max_hatch + (1 if ldm_pressure > 0 else 0)
         if current_bases >= effective_max_hatch:
             return None
 
-        # Hard gate: don't queue another expansion while ANY hatchery order
-        # is in flight — our queue OR a drone actively en route to build one.
-        # This prevents the MorphTracker DONE→prune gap from causing double queues.
-        if bot.construction_queue.count_active_of_type(UnitID.HATCHERY) > 0:
-            return None
-        if hatch_morphing > 0:
-            return None
-
-        # Mineral gate.
-        # Under LDM pressure halve the threshold (300 → 150): workers are
-        # already out there mining, so queue the expansion the moment we can
-        # afford it rather than waiting to bank up further.
-        effective_mineral_threshold = (
-            self._EXPAND_MIN_MINERALS // 2 if ldm_pressure > 0
-            else self._EXPAND_MIN_MINERALS
-        )
-        if bot.minerals < effective_mineral_threshold:
-            return None
-
         # Drone count gate: require enough workers to justify a new base.
         # Normal: 10 per existing base.  Under LDM pressure those overflow
         # drones are exactly the workers who'd saturate the new hatchery, so
         # accept a lower bar of 8 per base — they count, they're just parked
         # far away right now.
         workers_per_base = 8 if ldm_pressure > 0 else 10
-        min_drones_to_expand = bot.townhalls.ready.amount * workers_per_base
+        min_drones_to_expand = _ready_townhall_count(bot) * workers_per_base
         if len(bot.workers) < min_drones_to_expand:
-            log.debug(
-                "ZergStructureBuildTactic: expansion skipped — workers %d < %d needed"
-                " (ldm_pressure=%d)",
-                len(bot.workers), min_drones_to_expand, ldm_pressure,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergStructureBuildTactic: expansion skipped — workers %d < %d needed"
+                    " (ldm_pressure=%d)",
+                    len(bot.workers), min_drones_to_expand, ldm_pressure,
+                    frame=bot.state.game_loop,
+                )
             return None
 
         # ── Defensive territory gate ─────────────────────────────────────────
@@ -1806,19 +2180,23 @@ class ZergStructureBuildTactic(BuildingTacticModule):
                 bot, heuristics, target_base_count
             )
             if not safe:
-                log.debug(
-                    "ZergStructureBuildTactic: expansion blocked by defend gate — %s",
-                    reason,
-                    frame=bot.state.game_loop,
-                )
+                if log.is_enabled_for(logging.DEBUG):
+                    log.debug(
+                        "ZergStructureBuildTactic: expansion blocked by defend gate — %s",
+                        reason,
+                        frame=bot.state.game_loop,
+                    )
                 return None
 
         # Saturation trigger: use surplus_harvesters (accounts for gas workers)
         # so gas workers don't inflate the "assigned" count against a
         # mineral-only ideal.  Expand when bases are ≥75% saturated on average,
         # or when minerals are banking hard (≥600).
-        total_surplus = sum(th.surplus_harvesters for th in bot.townhalls.ready)
-        total_ideal   = sum(th.ideal_harvesters   for th in bot.townhalls.ready)
+        # One pass over the ready townhalls for both totals.
+        total_surplus = total_ideal = 0
+        for th in bot.townhalls.ready:
+            total_surplus += th.surplus_harvesters
+            total_ideal   += th.ideal_harvesters
         # surplus_harvesters = assigned - ideal.  Negative = under-saturated.
         # avg_saturation: 1.0 = perfect, >1.0 = over, <1.0 = under.
         avg_saturation = (total_ideal + total_surplus) / max(total_ideal, 1)
@@ -1827,7 +2205,6 @@ class ZergStructureBuildTactic(BuildingTacticModule):
         # Strategy expand_bias lowers the saturation threshold (positive = expand earlier).
         # expand_bias = +0.25  → threshold 0.675 (expand at 67.5% saturation)
         # expand_bias = -0.30  → threshold 0.840 (need 84% saturation)
-        profile = current_strategy.profile()
         sat_threshold = max(0.50, 0.75 - profile.expand_bias * 0.30)
 
         # Mined-out base bypass: if any owned base has no minerals left, workers
@@ -1837,11 +2214,12 @@ class ZergStructureBuildTactic(BuildingTacticModule):
         # and expand immediately — there's nowhere else for those drones to go.
         mined_out_count = heuristics.mined_out_bases
         if mined_out_count == 0 and avg_saturation < sat_threshold and not banking_hard:
-            log.debug(
-                "ZergStructureBuildTactic: expansion skipped — sat %.0f%% < threshold %.0f%% (expand_bias=%.2f)",
-                avg_saturation * 100, sat_threshold * 100, profile.expand_bias,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergStructureBuildTactic: expansion skipped — sat %.0f%% < threshold %.0f%% (expand_bias=%.2f)",
+                    avg_saturation * 100, sat_threshold * 100, profile.expand_bias,
+                    frame=bot.state.game_loop,
+                )
             return None
         if mined_out_count > 0:
             log.info(
@@ -1851,12 +2229,7 @@ class ZergStructureBuildTactic(BuildingTacticModule):
             )
 
         # Verify a free expansion slot exists.
-        taken = {th.position for th in bot.townhalls}
-        free_expansion = None
-        for exp in bot.expansion_locations_list:
-            if exp not in taken:
-                free_expansion = exp
-                break
+        free_expansion = self._free_expansion(bot)
         if free_expansion is None:
             return None
 
@@ -1879,14 +2252,32 @@ class ZergStructureBuildTactic(BuildingTacticModule):
             avg_saturation * 100, bot.minerals,
             frame=bot.state.game_loop,
         )
+        return confidence, evidence
 
-        return BuildingIdea(
-            building_module=self,
-            action=BuildingAction.TRAIN,
-            confidence=confidence,
-            evidence=evidence,
-            train_type=UnitID.HATCHERY,
-        )
+    @staticmethod
+    def _free_expansion(bot) -> Optional[Point2]:
+        """
+        First expansion location without a townhall on it.
+
+        Only changes when townhalls are added or lost, so the scan is
+        shared by every hatchery that gets this far in the same frame.
+        """
+        cache = bot.frame_cache
+        townhall_count = bot.townhalls.amount
+        memo = cache.free_expansion
+        if memo is None or memo[0] != townhall_count:
+            # Plain (x, y) tuple keys: Point2 hashes and compares in Python
+            # (hash(tuple(self)) plus an epsilon zip in __eq__), a plain
+            # tuple does both in C. Equal hashes already require identical
+            # floats, so exact-tuple membership matches the Point2 test.
+            taken = {(th.position[0], th.position[1]) for th in bot.townhalls}
+            free_expansion = None
+            for exp in bot.expansion_locations_list:
+                if (exp[0], exp[1]) not in taken:
+                    free_expansion = exp
+                    break
+            memo = cache.free_expansion = (townhall_count, free_expansion)
+        return memo[1]
 
     def _counter_structure_need(self, bot, counter_ctx):
         """
@@ -1899,7 +2290,7 @@ class ZergStructureBuildTactic(BuildingTacticModule):
                 continue
             structure_type, prereq, min_minerals = entry
             # Only suggest if we don't already have this structure
-            if bot.structures(structure_type).ready or bot.structures(structure_type).not_ready:
+            if _structures_of(structure_type, bot):
                 continue
             if bot.construction_queue.count_active_of_type(structure_type) > 0:
                 continue
@@ -1941,6 +2332,23 @@ _QUEEN_BASE_CONFIDENCE: float = 0.97
 # zerglings get trained alongside the second+ queens in early game.
 _QUEEN_SECONDARY_CONFIDENCE: float = 0.78
 
+def _queen_status(bot) -> tuple[int, int, float, int]:
+    """
+    (ready_hatcheries, queens, pending_queens, quota), cached per frame.
+
+    Both the queen tactic and ZergStructureBuildTactic's queen gate need
+    these every tick; none of them can change until the next observation.
+    """
+    cache = bot.frame_cache
+    status = cache.queen_status
+    if status is None:
+        hatcheries = _ready_townhall_count(bot)
+        queens = len(_units_of(UnitID.QUEEN, bot))
+        pending = _pending(UnitID.QUEEN, bot)
+        quota = max(_MIN_QUEENS, int(hatcheries * _MAX_QUEENS_PER_HATCHERY))
+        status = cache.queen_status = (hatcheries, queens, pending, quota)
+    return status
+
 
 class ZergQueenProductionTactic(BuildingTacticModule):
     """
@@ -1977,45 +2385,50 @@ class ZergQueenProductionTactic(BuildingTacticModule):
     })
 
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        if not _is_townhall(building.type_id):
             return False
         if not self._building_is_ready(building):
-            log.debug(
-                "ZergQueenProductionTactic: %s not ready (build_progress=%.2f) — skipping",
-                building.type_id.name,
-                building.build_progress,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergQueenProductionTactic: %s not ready (build_progress=%.2f) — skipping",
+                    building.type_id.name,
+                    building.build_progress,
+                    frame=bot.state.game_loop,
+                )
             return False
         if not self._building_is_idle(building):
-            log.debug(
-                "ZergQueenProductionTactic: %s not idle (orders=%s) — skipping",
-                building.type_id.name,
-                [o.ability.id.name for o in building.orders],
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergQueenProductionTactic: %s not idle (orders=%s) — skipping",
+                    building.type_id.name,
+                    [o.ability.id.name for o in building.orders],
+                    frame=bot.state.game_loop,
+                )
             return False
         # Queens require a Spawning Pool
-        pool_ready = bool(bot.structures(UnitID.SPAWNINGPOOL).ready)
+        pool_ready = UnitID.SPAWNINGPOOL in _ready_structure_types(bot)
         if not pool_ready:
-            log.debug(
-                "ZergQueenProductionTactic: SpawningPool not ready — skipping",
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergQueenProductionTactic: SpawningPool not ready — skipping",
+                    frame=bot.state.game_loop,
+                )
             return False
         if bot.supply_left < 2:
-            log.debug(
-                "ZergQueenProductionTactic: supply_left=%d < 2 — skipping",
-                bot.supply_left,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergQueenProductionTactic: supply_left=%d < 2 — skipping",
+                    bot.supply_left,
+                    frame=bot.state.game_loop,
+                )
             return False
         if bot.minerals < 150:
-            log.debug(
-                "ZergQueenProductionTactic: minerals=%d < 150 — skipping",
-                bot.minerals,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergQueenProductionTactic: minerals=%d < 150 — skipping",
+                    bot.minerals,
+                    frame=bot.state.game_loop,
+                )
             return False
         return True
 
@@ -2027,42 +2440,39 @@ class ZergQueenProductionTactic(BuildingTacticModule):
         current_strategy: "Strategy",
         counter_ctx: "CounterContext",
     ) -> Optional[BuildingIdea]:
-        hatchery_count = bot.structures.filter(
-            lambda s: s.type_id in self.BUILDING_TYPES and s.is_ready
-        ).amount
+        # Ready hatcheries, existing queens + pending queen eggs, and the quota
+        hatchery_count, queen_count, pending_queens, quota = _queen_status(bot)
         if hatchery_count == 0:
-            log.debug(
-                "ZergQueenProductionTactic: no ready hatcheries — returning None",
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergQueenProductionTactic: no ready hatcheries — returning None",
+                    frame=bot.state.game_loop,
+                )
             return None
 
-        # Count existing queens + pending queen eggs
-        queen_count = bot.units(UnitID.QUEEN).amount
-        pending_queens = bot.already_pending(UnitID.QUEEN)
         effective_queens = queen_count + pending_queens
 
-        quota = max(_MIN_QUEENS, int(hatchery_count * _MAX_QUEENS_PER_HATCHERY))
-
-        log.debug(
-            "ZergQueenProductionTactic: queens=%d pending=%.1f effective=%.1f quota=%d hatcheries=%d minerals=%d supply_left=%d",
-            queen_count,
-            pending_queens,
-            effective_queens,
-            quota,
-            hatchery_count,
-            bot.minerals,
-            bot.supply_left,
-            frame=bot.state.game_loop,
-        )
-
-        if effective_queens >= quota:
+        if log.is_enabled_for(logging.DEBUG):
             log.debug(
-                "ZergQueenProductionTactic: quota met (effective=%.1f >= quota=%d) — returning None",
+                "ZergQueenProductionTactic: queens=%d pending=%.1f effective=%.1f quota=%d hatcheries=%d minerals=%d supply_left=%d",
+                queen_count,
+                pending_queens,
                 effective_queens,
                 quota,
+                hatchery_count,
+                bot.minerals,
+                bot.supply_left,
                 frame=bot.state.game_loop,
             )
+
+        if effective_queens >= quota:
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergQueenProductionTactic: quota met (effective=%.1f >= quota=%d) — returning None",
+                    effective_queens,
+                    quota,
+                    frame=bot.state.game_loop,
+                )
             return None  # quota met — don't train more
 
         deficit = quota - effective_queens
@@ -2086,13 +2496,14 @@ class ZergQueenProductionTactic(BuildingTacticModule):
             "conf_source": conf_source,
         }
 
-        log.debug(
-            "ZergQueenProductionTactic: generating TRAIN_QUEEN idea (conf=%.3f deficit=%.1f source=%s)",
-            confidence,
-            deficit,
-            conf_source,
-            frame=bot.state.game_loop,
-        )
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(
+                "ZergQueenProductionTactic: generating TRAIN_QUEEN idea (conf=%.3f deficit=%.1f source=%s)",
+                confidence,
+                deficit,
+                conf_source,
+                frame=bot.state.game_loop,
+            )
 
         return BuildingIdea(
             building_module=self,
@@ -2116,7 +2527,7 @@ class ZergQueenProductionTactic(BuildingTacticModule):
             )
             return False
 
-        if not bot.can_afford(UnitID.QUEEN):
+        if not _can_afford_unit(UnitID.QUEEN, bot):
             log.warning(
                 "ZergQueenProductionTactic: cannot afford Queen at execute time "
                 "(minerals=%d vespene=%d supply_left=%d) — idea should not have been generated",
@@ -2134,8 +2545,8 @@ class ZergQueenProductionTactic(BuildingTacticModule):
             building.tag,
             building.type_id.name,
             result,
-            bot.units(UnitID.QUEEN).amount,
-            bot.already_pending(UnitID.QUEEN),
+            len(_units_of(UnitID.QUEEN, bot)),
+            _pending(UnitID.QUEEN, bot),
             bot.minerals,
             bot.supply_left,
             frame=bot.state.game_loop,
@@ -2169,6 +2580,18 @@ def _effective_overlord_threshold(bot: "ManifestorBot") -> int:
         return 10  # late game: aggressive to reach 200
 
 
+# Hard cap on overlords (sufficient to reach 200 supply).
+_MAX_OVERLORDS: int = 25
+
+# Overlord confidence = base + deficit * step, clamped to 1.0. The clamp
+# point is precomputed so the hot path is one compare instead of min().
+_OVERLORD_BASE_CONFIDENCE: float = 0.70
+_OVERLORD_CONFIDENCE_PER_SUPPLY: float = 0.08
+_OVERLORD_CONFIDENCE_CLAMP_DEFICIT: float = (
+    (1.0 - _OVERLORD_BASE_CONFIDENCE) / _OVERLORD_CONFIDENCE_PER_SUPPLY
+)
+
+
 def _max_pending_overlords(bot: "ManifestorBot") -> int:
     """How many overlords may be in-flight simultaneously.
 
@@ -2181,6 +2604,36 @@ def _max_pending_overlords(bot: "ManifestorBot") -> int:
     return 2
 
 
+@dataclass(slots=True)
+class _MacroSnapshot:
+    """
+    Supply-planning values that are fixed for a whole game loop.
+
+    supply_left and minerals are deliberately absent: python-sc2 deducts
+    them as soon as a train command is issued, so they must be read live.
+    """
+    supply_cap: float
+    pending_overlords: float
+    overlord_threshold: int
+    max_pending_overlords: int
+    overlord_count: int
+
+
+def _macro_snapshot(bot: "ManifestorBot") -> _MacroSnapshot:
+    """Return this frame's _MacroSnapshot, building it on first use."""
+    cache = bot.frame_cache
+    snap = cache.macro_snapshot
+    if snap is None:
+        snap = cache.macro_snapshot = _MacroSnapshot(
+            supply_cap=bot.supply_cap,
+            pending_overlords=_pending(UnitID.OVERLORD, bot),
+            overlord_threshold=_effective_overlord_threshold(bot),
+            max_pending_overlords=_max_pending_overlords(bot),
+            overlord_count=len(_units_of(UnitID.OVERLORD, bot)),
+        )
+    return snap
+
+
 class ZergOverlordProductionTactic(BuildingTacticModule):
     """
     Train Overlords from larva (via an idle Hatchery/Lair/Hive as the anchor)
@@ -2204,7 +2657,15 @@ class ZergOverlordProductionTactic(BuildingTacticModule):
     })
 
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        if not _is_townhall(building.type_id):
+            return False
+        # Supply-comfortable frames are the common case and generate_idea
+        # would reject them anyway. supply_left is read live; the threshold
+        # comes from the per-frame macro snapshot.
+        if bot.supply_left > _macro_snapshot(bot).overlord_threshold:
+            return False
+        # Larva-starved frames are common early; bail before the larva scan.
+        if not bot.larva:
             return False
         if not self._building_is_ready(building):
             return False
@@ -2213,12 +2674,13 @@ class ZergOverlordProductionTactic(BuildingTacticModule):
         if bot.minerals < 100:
             return False
         # Need nearby larva to train an Overlord
-        if not bot.larva.closer_than(15, building.position):
-            log.debug(
-                "ZergOverlordProductionTactic: no larva near %s — skipping",
-                building.type_id.name,
-                frame=bot.state.game_loop,
-            )
+        if not _larva_near(building, bot):
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergOverlordProductionTactic: no larva near %s — skipping",
+                    building.type_id.name,
+                    frame=bot.state.game_loop,
+                )
             return False
         return True
 
@@ -2230,44 +2692,47 @@ class ZergOverlordProductionTactic(BuildingTacticModule):
         current_strategy: "Strategy",
         counter_ctx: "CounterContext",
     ) -> Optional[BuildingIdea]:
+        snap = _macro_snapshot(bot)
         supply_left = bot.supply_left
-        pending_overlords = bot.already_pending(UnitID.OVERLORD)
-        threshold = _effective_overlord_threshold(bot)
-
-        log.debug(
-            "ZergOverlordProductionTactic: supply_left=%d pending_overlords=%.1f threshold=%d",
-            supply_left,
-            pending_overlords,
-            threshold,
-            frame=bot.state.game_loop,
-        )
+        pending_overlords = snap.pending_overlords
+        threshold = snap.overlord_threshold
 
-        # Don't queue if we already have enough overlords en route
-        max_pending = _max_pending_overlords(bot)
-        if pending_overlords >= max_pending:
-            return None
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(
+                "ZergOverlordProductionTactic: supply_left=%d pending_overlords=%.1f threshold=%d",
+                supply_left,
+                pending_overlords,
+                threshold,
+                frame=bot.state.game_loop,
+            )
 
-        if supply_left > threshold:
-            return None  # not supply-pressured yet
+        # Not supply-pressured yet, or enough overlords already en route
+        deficit = threshold - supply_left
+        if deficit < 0 or pending_overlords >= snap.max_pending_overlords:
+            return None
 
         # Already at max supply cap — no more overlords ever needed
-        if bot.supply_cap >= 200:
+        if snap.supply_cap >= 200:
             return None
 
-        # Hard cap at 25 overlords (sufficient to reach 200 supply)
-        MAX_OVERLORDS = 25
-        existing = bot.units(UnitID.OVERLORD).amount + int(bot.already_pending(UnitID.OVERLORD))
-        if existing >= MAX_OVERLORDS:
+        existing = snap.overlord_count + int(pending_overlords)
+        if existing >= _MAX_OVERLORDS:
             return None
 
-        deficit = threshold - supply_left
         # Scale confidence: critical at 0 supply left, moderate near threshold
-        confidence = min(1.0, 0.70 + deficit * 0.08)
-        evidence = {
-            "supply_left": supply_left,
-            "pending_overlords": pending_overlords,
-            "supply_deficit_vs_threshold": deficit,
-        }
+        if deficit < _OVERLORD_CONFIDENCE_CLAMP_DEFICIT:
+            confidence = _OVERLORD_BASE_CONFIDENCE + deficit * _OVERLORD_CONFIDENCE_PER_SUPPLY
+        else:
+            confidence = 1.0
+
+        # Nothing downstream reads overlord evidence; it only exists for
+        # debug review, so skip populating it when DEBUG is off
+        # (MANIFESTOR_LOG_LEVEL above DEBUG — see logger.LOG_LEVEL).
+        evidence: dict = {}
+        if log.is_enabled_for(logging.DEBUG):
+            evidence["supply_left"] = supply_left
+            evidence["pending_overlords"] = pending_overlords
+            evidence["supply_deficit_vs_threshold"] = deficit
 
         return BuildingIdea(
             building_module=self,
@@ -2279,7 +2744,7 @@ class ZergOverlordProductionTactic(BuildingTacticModule):
 
     def execute(self, building: "Unit", idea: BuildingIdea, bot: "ManifestorBot") -> bool:
         """Overlords are produced from larva — use the generic _execute_train path."""
-        if idea.train_type != UnitID.OVERLORD:
+        if idea.train_type is not UnitID.OVERLORD:
             log.error(
                 "ZergOverlordProductionTactic.execute called with non-overlord type: %s",
                 idea.train_type,
@@ -2289,18 +2754,19 @@ class ZergOverlordProductionTactic(BuildingTacticModule):
 
         result = self._execute_train(building, idea, bot)
         if result:
-            log.info(
-                "ZergOverlordProductionTactic: trained Overlord (supply_left=%d)",
-                bot.supply_left,
-                frame=bot.state.game_loop,
-            )
-        else:
+            if log.is_enabled_for(logging.INFO):
+                log.info(
+                    "ZergOverlordProductionTactic: trained Overlord (supply_left=%d)",
+                    bot.supply_left,
+                    frame=bot.state.game_loop,
+                )
+        elif log.is_enabled_for(logging.WARNING):
+            # Level already checked, so format once up front rather than
+            # handing logging an args tuple to %-format later.
             log.warning(
-                "ZergOverlordProductionTactic: failed to train Overlord "
-                "(supply_left=%d minerals=%d larva_near=%d)",
-                bot.supply_left,
-                bot.minerals,
-                bot.larva.closer_than(15, building.position).amount,
+                f"ZergOverlordProductionTactic: failed to train Overlord "
+                f"(supply_left={bot.supply_left:.0f} minerals={bot.minerals} "
+                f"larva_near={_larva_near(building, bot)})",
                 frame=bot.state.game_loop,
             )
         return result
@@ -2310,6 +2776,28 @@ class ZergOverlordProductionTactic(BuildingTacticModule):
 # 7. Tech Morph (Hatchery → Lair → Hive)
 # ---------------------------------------------------------------------------
 
+# The only train_types ZergTechMorphTactic ever emits, mapped to the morph
+# ability issued on the townhall. Issuing the ability directly skips
+# Unit.train()'s game_data creation-ability lookup.
+_TECH_MORPH_ABILITIES: dict = {
+    UnitID.LAIR: AbilityId.UPGRADETOLAIR_LAIR,
+    UnitID.HIVE: AbilityId.UPGRADETOHIVE_HIVE,
+}
+
+# Source townhall → (train_type, existing_types, prereq, min_minerals,
+# min_gas, min_townhalls). Lair and Hive differ only in these constants,
+# so both tiers share ZergTechMorphTactic._consider_morph. existing_types
+# lists the structures that make the morph unnecessary.
+_TECH_MORPH_RULES: dict = {
+    UnitID.HATCHERY: (
+        UnitID.LAIR, (UnitID.LAIR, UnitID.HIVE), UnitID.SPAWNINGPOOL, 150, 100, 2,
+    ),
+    UnitID.LAIR: (
+        UnitID.HIVE, (UnitID.HIVE,), UnitID.INFESTATIONPIT, 200, 150, 3,
+    ),
+}
+
+
 class ZergTechMorphTactic(BuildingTacticModule):
     """
     Morph a Hatchery into a Lair, or a Lair into a Hive.
@@ -2330,7 +2818,9 @@ class ZergTechMorphTactic(BuildingTacticModule):
     })
 
     def is_applicable(self, building, bot) -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        # Same shared townhall gate as the other tactics; a HIVE is never
+        # routed here (BUILDING_TYPES) and has no _TECH_MORPH_RULES entry.
+        if not _is_townhall(building.type_id):
             return False
         if not self._building_is_ready(building):
             return False
@@ -2339,88 +2829,53 @@ class ZergTechMorphTactic(BuildingTacticModule):
         return True
 
     def generate_idea(self, building, bot, heuristics, current_strategy, counter_ctx):
-        # ── Hatchery → Lair ───────────────────────────────────────────
-        if building.type_id == UnitID.HATCHERY:
-            return self._consider_lair(building, bot)
-
-        # ── Lair → Hive ──────────────────────────────────────────────
-        if building.type_id == UnitID.LAIR:
-            return self._consider_hive(building, bot)
-
-        return None
-
-    def _consider_lair(self, building, bot):
-        # Already have a Lair or Hive (or one morphing)?
-        lair_count = (
-            bot.structures(UnitID.LAIR).amount
-            + bot.structures(UnitID.HIVE).amount
-            + bot.already_pending(UnitID.LAIR)
-        )
-        if lair_count > 0:
-            return None
-
-        # Prerequisite: Spawning Pool ready
-        if not bot.structures(UnitID.SPAWNINGPOOL).ready:
-            return None
-
-        # Don't morph your only hatchery
-        if len(bot.townhalls.ready) < 2:
-            return None
-
-        # Resource gate
-        if bot.minerals < 150 or bot.vespene < 100:
+        rule = _TECH_MORPH_RULES.get(building.type_id)
+        if rule is None:
             return None
+        return self._consider_morph(bot, *rule)
 
-        confidence = 0.80
-        evidence = {
-            "tech_morph": "LAIR",
-            "townhalls": len(bot.townhalls.ready),
-        }
-
-        log.info(
-            "ZergTechMorphTactic: Lair morph ready (minerals=%d gas=%d townhalls=%d)",
-            bot.minerals, bot.vespene, len(bot.townhalls.ready),
-            frame=bot.state.game_loop,
-        )
-
-        return BuildingIdea(
-            building_module=self,
-            action=BuildingAction.TRAIN,
-            confidence=confidence,
-            evidence=evidence,
-            train_type=UnitID.LAIR,
-        )
-
-    def _consider_hive(self, building, bot):
-        # Already have a Hive (or one morphing)?
-        hive_count = (
-            bot.structures(UnitID.HIVE).amount
-            + bot.already_pending(UnitID.HIVE)
-        )
-        if hive_count > 0:
+    def _consider_morph(
+        self,
+        bot,
+        train_type: UnitID,
+        existing_types: tuple,
+        prereq: UnitID,
+        min_minerals: int,
+        min_gas: int,
+        min_townhalls: int,
+    ):
+        """Shared Lair / Hive gate; the per-tier constants come from _TECH_MORPH_RULES."""
+        # Resource gate — scalar reads, and the most common rejection.
+        if bot.minerals < min_minerals or bot.vespene < min_gas:
             return None
 
-        # Prerequisite: Infestation Pit ready
-        if not bot.structures(UnitID.INFESTATIONPIT).ready:
+        # Already have the target tier (or better, or one morphing)? Only
+        # existence matters, so short-circuit on the per-frame type index.
+        for existing in existing_types:
+            if _structures_of(existing, bot):
+                return None
+        if _pending(train_type, bot):
             return None
 
-        # Want a solid economy before committing to Hive tech
-        if len(bot.townhalls.ready) < 3:
+        # Prerequisite tech structure ready
+        if prereq not in _ready_structure_types(bot):
             return None
 
-        # Resource gate
-        if bot.minerals < 200 or bot.vespene < 150:
+        # Lair: don't morph your only hatchery.
+        # Hive: want a solid economy before committing to Hive tech.
+        townhalls = _ready_townhall_count(bot)
+        if townhalls < min_townhalls:
             return None
 
         confidence = 0.80
         evidence = {
-            "tech_morph": "HIVE",
-            "townhalls": len(bot.townhalls.ready),
+            "tech_morph": train_type.name,
+            "townhalls": townhalls,
         }
 
         log.info(
-            "ZergTechMorphTactic: Hive morph ready (minerals=%d gas=%d townhalls=%d)",
-            bot.minerals, bot.vespene, len(bot.townhalls.ready),
+            "ZergTechMorphTactic: %s morph ready (minerals=%d gas=%d townhalls=%d)",
+            train_type.name.title(), bot.minerals, bot.vespene, townhalls,
             frame=bot.state.game_loop,
         )
 
@@ -2429,7 +2884,7 @@ class ZergTechMorphTactic(BuildingTacticModule):
             action=BuildingAction.TRAIN,
             confidence=confidence,
             evidence=evidence,
-            train_type=UnitID.HIVE,
+            train_type=train_type,
         )
 
     def execute(self, building, idea, bot) -> bool:
@@ -2439,7 +2894,8 @@ class ZergTechMorphTactic(BuildingTacticModule):
         Cannot use _execute_train() because that routes through larva for
         Zerg units.  Lair/Hive are structure morphs issued on the building.
         """
-        if idea.train_type not in (UnitID.LAIR, UnitID.HIVE):
+        morph_ability = _TECH_MORPH_ABILITIES.get(idea.train_type)
+        if morph_ability is None:
             log.error(
                 "ZergTechMorphTactic: unexpected train_type %s",
                 idea.train_type,
@@ -2447,11 +2903,15 @@ class ZergTechMorphTactic(BuildingTacticModule):
             )
             return False
 
-        result = building.train(idea.train_type)
+        # subtract_cost keeps the same-tick resource bookkeeping train() did.
+        result = building(morph_ability, subtract_cost=True)
         if result:
             log.game_event(
                 "TECH_MORPH",
-                f"{building.type_id.name} → {idea.train_type.name} tag={building.tag}",
+                "%s → %s tag=%d",
+                building.type_id.name,
+                idea.train_type.name,
+                building.tag,
                 frame=bot.state.game_loop,
             )
         else:
@@ -2488,6 +2948,53 @@ def _gas_target_workers(vespene: int, ideal: int, bias: float) -> int:
     return ideal            # below slow tier — collect normally
 
 
+# Gather abilities a mineral-mining drone's first order can carry.
+_MINERAL_GATHER_IDS: frozenset = frozenset({
+    AbilityId.HARVEST_GATHER,
+    AbilityId.HARVEST_GATHER_DRONE,
+})
+
+def _mineral_miners(bot) -> list:
+    """
+    Drones actively mining MINERALS (not gas, not building) this frame.
+
+    Filters on the gather-target being a mineral field unit, not a geyser or
+    extractor — fixes the original bug where HARVEST_GATHER was used for both
+    mineral and gas gathering and drones already heading to gas were picked.
+
+    Built once per game loop and shared by every extractor's execute();
+    callers remove the drones they claim, so a second extractor in the same
+    tick cannot pick a drone whose gather order has not shown up in its
+    orders yet.
+    """
+    cache = bot.frame_cache
+    if cache.mineral_miners is not None:
+        return cache.mineral_miners
+
+    # Build a fast-lookup set of mineral field tags
+    mineral_tags: set[int] = {m.tag for m in bot.mineral_field}
+
+    candidates = []
+    for drone in bot.workers:
+        if not drone.orders:
+            continue
+        order = drone.orders[0]
+        if order.ability.id not in _MINERAL_GATHER_IDS:
+            continue
+        # Filter: target must be a mineral field, not a gas geyser or extractor.
+        # Not redundant with the ability check: HARVEST_GATHER_DRONE is also
+        # the order for drones gathering gas. UnitOrder always carries
+        # .target (tag, Point2 or None), so no getattr fallback is needed.
+        target_tag = order.target
+        if not isinstance(target_tag, int):
+            continue
+        if target_tag not in mineral_tags:
+            continue
+        candidates.append(drone)
+    cache.mineral_miners = candidates
+    return candidates
+
+
 class ZergGasWorkerTactic(BuildingTacticModule):
     """
     Explicitly assign idle or mineral-mining drones to gas buildings that are
@@ -2524,6 +3031,9 @@ class ZergGasWorkerTactic(BuildingTacticModule):
         UnitID.EXTRACTORRICH,
     })
 
+    # Evaluate extractors on every ~40th game loop, as documented above.
+    _STRIDE_FRAMES: int = 40
+
     def __init__(self) -> None:
         super().__init__()
         # extractor tag → pending drone orders not yet reflected in assigned_harvesters
@@ -2551,27 +3061,37 @@ class ZergGasWorkerTactic(BuildingTacticModule):
         return max(0, building.ideal_harvesters - effective)
 
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        # Frame stride: only every other building tick (the dispatcher runs
+        # on game_loop % 20 == 0). Multiples of the stride are multiples of
+        # 20, so every extractor is still evaluated together on those ticks.
+        if bot.state.game_loop % self._STRIDE_FRAMES:
+            return False
+        if not _is_extractor(building.type_id):
             return False
         if not self._building_is_ready(building):
-            log.debug(
-                "ZergGasWorkerTactic: extractor tag=%d not ready (progress=%.2f)",
-                building.tag,
-                building.build_progress,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergGasWorkerTactic: extractor tag=%d not ready (progress=%.2f)",
+                    building.tag,
+                    building.build_progress,
+                    frame=bot.state.game_loop,
+                )
             return False
-        # Use effective deficit (actual + pending) to avoid over-assigning
+        # Use effective deficit (actual + pending) to avoid over-assigning.
+        # _effective_deficit() must run on every ready extractor — it also
+        # folds newly registered harvesters out of _pending — so no cheaper
+        # assigned >= ideal pre-check is taken ahead of it.
         if self._effective_deficit(building) <= 0:
-            log.debug(
-                "ZergGasWorkerTactic: extractor tag=%d effectively saturated "
-                "(%d actual + %d pending >= %d ideal) — skipping",
-                building.tag,
-                building.assigned_harvesters,
-                self._pending.get(building.tag, 0),
-                building.ideal_harvesters,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergGasWorkerTactic: extractor tag=%d effectively saturated "
+                    "(%d actual + %d pending >= %d ideal) — skipping",
+                    building.tag,
+                    building.assigned_harvesters,
+                    self._pending.get(building.tag, 0),
+                    building.ideal_harvesters,
+                    frame=bot.state.game_loop,
+                )
             return False
         return True
 
@@ -2584,14 +3104,17 @@ class ZergGasWorkerTactic(BuildingTacticModule):
         counter_ctx: "CounterContext",
     ) -> Optional[BuildingIdea]:
         deficit = self._effective_deficit(building)
+        assigned = building.assigned_harvesters
+        ideal = building.ideal_harvesters
+        pending = self._pending.get(building.tag, 0)
         log.info(
             "ZergGasWorkerTactic: extractor tag=%d needs %d more workers "
             "(%d actual + %d pending / %d ideal)",
             building.tag,
             deficit,
-            building.assigned_harvesters,
-            self._pending.get(building.tag, 0),
-            building.ideal_harvesters,
+            assigned,
+            pending,
+            ideal,
             frame=bot.state.game_loop,
         )
 
@@ -2600,21 +3123,23 @@ class ZergGasWorkerTactic(BuildingTacticModule):
         # Tiered gas float control: stop assigning new workers when gas float
         # exceeds the cap threshold.  ZergGasWorkerPullTactic handles the active
         # removal of workers when the float rises above _GAS_TIER_STOP.
-        target = _gas_target_workers(bot.vespene, building.ideal_harvesters, profile.gas_ratio_bias)
         if bot.vespene >= _GAS_FLOAT_CAP:
-            log.debug(
-                "ZergGasWorkerTactic: gas=%d >= float_cap=%d (target=%d) — skipping new assignment",
-                bot.vespene, _GAS_FLOAT_CAP, target,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                # The tier target is only reported here, not acted on.
+                target = _gas_target_workers(bot.vespene, ideal, profile.gas_ratio_bias)
+                log.debug(
+                    "ZergGasWorkerTactic: gas=%d >= float_cap=%d (target=%d) — skipping new assignment",
+                    bot.vespene, _GAS_FLOAT_CAP, target,
+                    frame=bot.state.game_loop,
+                )
             return None
 
         confidence = max(0.40, 0.90 + profile.gas_ratio_bias)
         evidence = {
             "gas_deficit": deficit,
-            "assigned": building.assigned_harvesters,
-            "pending": self._pending.get(building.tag, 0),
-            "ideal": building.ideal_harvesters,
+            "assigned": assigned,
+            "pending": pending,
+            "ideal": ideal,
             "gas_ratio_bias": profile.gas_ratio_bias,
         }
         return BuildingIdea(
@@ -2628,84 +3153,54 @@ class ZergGasWorkerTactic(BuildingTacticModule):
     def execute(self, building: "Unit", idea: BuildingIdea, bot: "ManifestorBot") -> bool:
         """
         Find nearby mineral-mining drones and redirect them to this gas building.
-        Tracks redirected tags within the call so the same drone isn't picked twice.
+        The closest *deficit* mineral miners are taken together and removed
+        from the shared per-frame list, so no drone is picked twice.
         Updates _pending so is_applicable() won't over-assign on subsequent frames.
         """
+        # evidence is diagnostics only — re-derive the deficit. The second
+        # call in the same tick is a no-op on _pending/_last_seen.
         deficit = self._effective_deficit(building)
         if deficit <= 0:
             return False
 
-        redirected_tags: set[int] = set()
-        for _ in range(deficit):
-            drone = self._find_mineral_drone(building, bot, exclude=redirected_tags)
-            if drone is None:
-                log.warning(
-                    "ZergGasWorkerTactic: no available mineral drone to redirect to extractor tag=%d",
-                    building.tag,
-                    frame=bot.state.game_loop,
-                )
-                break
-            drone.gather(building)
-            redirected_tags.add(drone.tag)
-            log.info(
-                "ZergGasWorkerTactic: redirected drone tag=%d → extractor tag=%d",
-                drone.tag,
+        # Take the closest drones to the gas building to minimize travel
+        # time. nsmallest picks the same drones, in the same order, as
+        # repeatedly taking min() and removing it — in one pass. Squared
+        # distance on the unpacked extractor position keeps the ordering
+        # without a sqrt or a Point2 method call per drone.
+        gx, gy = building.position
+        candidates = _mineral_miners(bot)
+
+        def _dist_sq(d) -> float:
+            x, y = d.position
+            dx = x - gx
+            dy = y - gy
+            return dx * dx + dy * dy
+
+        selected = heapq.nsmallest(deficit, candidates, key=_dist_sq)
+        if len(selected) < deficit:
+            log.warning(
+                "ZergGasWorkerTactic: no available mineral drone to redirect to extractor tag=%d",
                 building.tag,
                 frame=bot.state.game_loop,
             )
 
-        count = len(redirected_tags)
+        for drone in selected:
+            drone.gather(building)
+            candidates.remove(drone)
+
+        count = len(selected)
         if count > 0:
+            log.info(
+                "ZergGasWorkerTactic: redirected %d drone(s) %s → extractor tag=%d",
+                count,
+                [d.tag for d in selected],
+                building.tag,
+                frame=bot.state.game_loop,
+            )
             self._pending[building.tag] = self._pending.get(building.tag, 0) + count
         return count > 0
 
-    def _find_mineral_drone(
-        self,
-        gas_building: "Unit",
-        bot: "ManifestorBot",
-        exclude: "set[int] | None" = None,
-    ):
-        """
-        Find the closest drone that is actively mining MINERALS (not gas, not building).
-
-        Filters on the gather-target being a mineral field unit, not a geyser or
-        extractor — fixes the original bug where HARVEST_GATHER was used for both
-        mineral and gas gathering and drones already heading to gas were picked.
-        """
-        from sc2.ids.ability_id import AbilityId
-        GATHER_ABILITIES = {
-            AbilityId.HARVEST_GATHER,
-            AbilityId.HARVEST_GATHER_DRONE,
-        }
-        if exclude is None:
-            exclude = set()
-
-        # Build a fast-lookup set of mineral field tags
-        mineral_tags: set[int] = {m.tag for m in bot.mineral_field}
-
-        candidates = []
-        for drone in bot.workers:
-            if drone.tag in exclude:
-                continue
-            if not drone.orders:
-                continue
-            order = drone.orders[0]
-            if order.ability.id not in GATHER_ABILITIES:
-                continue
-            # Filter: target must be a mineral field, not a gas geyser or extractor
-            target_tag = getattr(order, 'target', None)
-            if not isinstance(target_tag, int):
-                continue
-            if target_tag not in mineral_tags:
-                continue
-            candidates.append(drone)
-
-        if not candidates:
-            return None
-
-        # Pick the closest one to the gas building to minimize travel time
-        return min(candidates, key=lambda d: d.distance_to(gas_building.position))
-
 
 # ---------------------------------------------------------------------------
 # 8b. Gas Worker Pull-Off
@@ -2735,19 +3230,14 @@ class ZergGasWorkerPullTactic(BuildingTacticModule):
     })
 
     # SC2 ability IDs that indicate a drone is actively harvesting gas
-    _GAS_HARVEST_ABILITIES: frozenset = frozenset()
-
-    def __init__(self) -> None:
-        super().__init__()
-        from sc2.ids.ability_id import AbilityId
-        self._GAS_HARVEST_ABILITIES = frozenset({
-            AbilityId.HARVEST_GATHER,
-            AbilityId.HARVEST_GATHER_DRONE,
-            AbilityId.SMART,
-        })
+    _GAS_HARVEST_ABILITIES: frozenset = frozenset({
+        AbilityId.HARVEST_GATHER,
+        AbilityId.HARVEST_GATHER_DRONE,
+        AbilityId.SMART,
+    })
 
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        if not _is_extractor(building.type_id):
             return False
         if not self._building_is_ready(building):
             return False
@@ -2770,15 +3260,16 @@ class ZergGasWorkerPullTactic(BuildingTacticModule):
             return None  # already at or under target — nothing to pull
 
         excess = building.assigned_harvesters - target
-        log.debug(
-            "ZergGasWorkerPullTactic: extractor tag=%d assigned=%d target=%d excess=%d gas=%d",
-            building.tag,
-            building.assigned_harvesters,
-            target,
-            excess,
-            bot.vespene,
-            frame=bot.state.game_loop,
-        )
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(
+                "ZergGasWorkerPullTactic: extractor tag=%d assigned=%d target=%d excess=%d gas=%d",
+                building.tag,
+                building.assigned_harvesters,
+                target,
+                excess,
+                bot.vespene,
+                frame=bot.state.game_loop,
+            )
 
         return BuildingIdea(
             building_module=self,
@@ -2896,12 +3387,12 @@ class ZergStaticDefenseTactic(BuildingTacticModule):
     _CRAWLER_COOLDOWN_FRAMES: int = 224  # ~10 s at 22.4 fps / GameStep 2
 
     def is_applicable(self, building: "Unit", bot: "ManifestorBot") -> bool:
-        if building.type_id not in self.BUILDING_TYPES:
+        if not _is_townhall(building.type_id):
             return False
         if not self._building_is_ready(building):
             return False
         # Spine crawlers require a Spawning Pool
-        if not bot.structures(UnitID.SPAWNINGPOOL).ready:
+        if UnitID.SPAWNINGPOOL not in _ready_structure_types(bot):
             return False
         if bot.minerals < _CRAWLER_MIN_MINERALS:
             return False
@@ -2928,12 +3419,13 @@ class ZergStaticDefenseTactic(BuildingTacticModule):
         # just speeds up our own death.  Fortress mode bypasses this: if the
         # strategy machine decided to turtle it already did the phase check.
         if is_emergency and not is_fortress and heuristics.game_phase < 0.30:
-            log.debug(
-                "ZergStaticDefenseTactic: emergency threat=%.2f but game_phase=%.2f < 0.30 — skipping",
-                heuristics.threat_level,
-                heuristics.game_phase,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergStaticDefenseTactic: emergency threat=%.2f but game_phase=%.2f < 0.30 — skipping",
+                    heuristics.threat_level,
+                    heuristics.game_phase,
+                    frame=bot.state.game_loop,
+                )
             return None
 
         # ── Per-class cooldown ───────────────────────────────────────────────
@@ -2946,12 +3438,13 @@ class ZergStaticDefenseTactic(BuildingTacticModule):
             ZergStaticDefenseTactic._last_enqueued_frame >= 0
             and frames_since_last < ZergStaticDefenseTactic._CRAWLER_COOLDOWN_FRAMES
         ):
-            log.debug(
-                "ZergStaticDefenseTactic: cooldown active (%d/%d frames)",
-                frames_since_last,
-                ZergStaticDefenseTactic._CRAWLER_COOLDOWN_FRAMES,
-                frame=frame,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergStaticDefenseTactic: cooldown active (%d/%d frames)",
+                    frames_since_last,
+                    ZergStaticDefenseTactic._CRAWLER_COOLDOWN_FRAMES,
+                    frame=frame,
+                )
             return None
 
         confidence = 0.88 if is_fortress else 0.80
@@ -2960,11 +3453,11 @@ class ZergStaticDefenseTactic(BuildingTacticModule):
             "threat_level": round(heuristics.threat_level, 2),
         }
 
-        num_bases = max(1, bot.townhalls.ready.amount)
+        num_bases = max(1, _ready_townhall_count(bot))
 
         # ── Spine Crawlers (ground defence) ─────────────────────────────
         target_spines = num_bases * _SPINES_PER_BASE
-        existing_spines = bot.structures(UnitID.SPINECRAWLER).amount
+        existing_spines = len(_structures_of(UnitID.SPINECRAWLER, bot))
         pending_spines = bot.construction_queue.count_active_of_type(UnitID.SPINECRAWLER)
         if existing_spines + pending_spines < target_spines:
             evidence["spine_needed"] = target_spines - existing_spines - pending_spines
@@ -2985,7 +3478,7 @@ class ZergStaticDefenseTactic(BuildingTacticModule):
 
         # ── Spore Crawlers (anti-air + detection) ───────────────────────
         target_spores = num_bases * _SPORES_PER_BASE
-        existing_spores = bot.structures(UnitID.SPORECRAWLER).amount
+        existing_spores = len(_structures_of(UnitID.SPORECRAWLER, bot))
         pending_spores = bot.construction_queue.count_active_of_type(UnitID.SPORECRAWLER)
         if existing_spores + pending_spores < target_spores:
             evidence["spore_needed"] = target_spores - existing_spores - pending_spores
@@ -3026,9 +3519,10 @@ class ZergStaticDefenseTactic(BuildingTacticModule):
                 frame=bot.state.game_loop,
             )
         else:
-            log.debug(
-                "ZergStaticDefenseTactic: queue rejected %s (already pending?)",
-                idea.train_type.name,
-                frame=bot.state.game_loop,
-            )
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug(
+                    "ZergStaticDefenseTactic: queue rejected %s (already pending?)",
+                    idea.train_type.name,
+                    frame=bot.state.game_loop,
+                )
         return accepted
\ No newline at end of file
@@ -149,7 +149,7 @@ class CrawlerUprootBuildingTactic(BuildingTacticModule):
         if not self._building_is_ready(building):
             return False
         # Don't uproot if already uprooting or has any active order
-        if building.orders:
+        if not self._building_is_idle(building):
             return False
         # Don't uproot while enemies are close — we'd lose defensive coverage
         if bot.enemy_units.closer_than(DANGER_RADIUS, building.position):
@@ -169,7 +169,11 @@ class BanelingMorphTactic(TacticModule):
         if unit.is_burrowed:
             return False
         # Quick pre-check: baneling nest must exist before doing any math.
-        if not bot.structures(UnitID.BANELINGNEST).ready:
+        # Ares' per-frame structure dict: this runs for every zergling.
+        if not any(
+            s.is_ready
+            for s in bot.mediator.get_own_structures_dict.get(UnitID.BANELINGNEST, ())
+        ):
             return False
         return True
 